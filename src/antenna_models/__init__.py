@@ -7,4 +7,15 @@ from .itus465 import ITUS465
 from .itus580 import ITUS580
 
 __all__ = ['ITUF1336s', 'ITUF1336o', 'ITUF1336lg', 'ITUF699', 'ITUF1245',
-           'ITUS465', 'ITUS580']
+           'ITUS465', 'ITUS580', 'MODEL_REGISTRY']
+
+# Model classes by name, as accepted by controller.Antenna
+MODEL_REGISTRY = {
+    'ITUF1336s': ITUF1336s,
+    'ITUF1336o': ITUF1336o,
+    'ITUF1336lg': ITUF1336lg,
+    'ITUF699': ITUF699,
+    'ITUF1245': ITUF1245,
+    'ITUS465': ITUS465,
+    'ITUS580': ITUS580,
+}
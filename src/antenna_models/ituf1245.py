@@ -7,7 +7,11 @@ from 1 GHz to 86 GHz"
 """
 
 
+import bisect
+import functools
+import itertools
 import math
+import numpy as np
 from base import BaseAntenna
 
 
@@ -98,6 +102,45 @@ class ITUF1245(BaseAntenna):
             d_to_l = self.params['diameter_m'] / wavelength
             self.params['d_to_l'] = d_to_l
 
+        # ~ Calculate constants of the gain formulas ~
+
+        d_to_l = self.params['d_to_l']
+        g_max = self.params['max_gain_dbi']
+
+        self._g_1 = 2 + 15 * math.log10(d_to_l)
+
+        if self.params['calc_opt'] == 'Rec. 2':
+            # phi_m is not defined if g_max is below g_1
+            if g_max < self._g_1:
+                raise ValueError(
+                    f"Invalid parameter value! max_gain_dbi must be >= "
+                    f"{self._g_1:,.2f} dBi for the resulting D/lambda "
+                    f"ratio of {d_to_l:,.2f}"
+                )
+            self._phi_m = 20 * (1 / d_to_l) * math.sqrt(g_max - self._g_1)
+            self._phi_r = 12.02 * (d_to_l**(-0.6))
+        else:
+            if d_to_l > 100:
+                self._phi_r = 15.85 * d_to_l**(-0.6)
+            else:
+                self._phi_r = 39.8 * d_to_l**(-0.8)
+            # Coefficient of phi in the argument of sin function.
+            # It's not clear how the argument must be calc.; the ratio
+            # 3*pi*phi / (2*phi_r) is further converted to radians,
+            # and that conversion is folded into the coefficient
+            self._sin_coeff = math.radians(3 * math.pi / (2 * self._phi_r))
+
+        # Select the gain formulas and angles where they switch over
+        if self.params['calc_opt'] == 'Rec. 2':
+            breakpoints, self._gain_funcs = self.__gain_rec2(math)
+            _, self._gain_array_funcs = self.__gain_rec2(np)
+        else:
+            breakpoints, self._gain_funcs = self.__gain_rec3(math)
+            _, self._gain_array_funcs = self.__gain_rec3(np)
+
+        # A region is empty if its angle is below the preceding one
+        self._breakpoints = list(itertools.accumulate(breakpoints, max))
+
 
     def _update_specs(self):
         """Update specs data."""
@@ -113,31 +156,32 @@ class ITUF1245(BaseAntenna):
         phi_3 = 35 / self.params['d_to_l']  # Ref. to [1] Recommends 4
         self.specs['h_width'] = round(phi_3, 2)
         self.specs['v_width'] = round(phi_3, 2)  # same as for h_width
-        # Calculate front-to-back ratio
-        f_to_b = self.gain(off_axis_angle=0) - self.gain(off_axis_angle=180)
-        self.specs['front_to_back'] = round(f_to_b, 2)
         self.specs['gain']  = round(self.params['max_gain_dbi'], 2)
         self.specs['tilt'] = 0
         self.specs['polarization'] = 'n/a'
         self.specs['comment'] = comment_str
 
         # Generate angles from 0 to 360 (inclusive)
-        angles = [i for i in range(0, 361)]
-
-        # Create empty lists for h_loss
-        h_loss = []
+        angles = np.arange(361)
 
         g_max = self.params['max_gain_dbi']  # for attenuation calc.
 
-        # Calculate h_loss array's values
-        for angle in angles:
-            # calc. gain, then attenuation, then append
-            h_loss.append(round(g_max - self.gain(off_axis_angle=angle), 2))
+        # Calculate gains for all angles at once
+        h_loss = self._gain_array(angles)
+
+        # Calculate front-to-back ratio from gains at 0 and 180 deg.,
+        # by the scalar formulas to keep int gains as int
+        f_to_b = self._gain(0) - self._gain(180)
+        self.specs['front_to_back'] = round(f_to_b, 2)
+
+        # Turn gains into rounded attenuation
+        h_loss = self._round_losses(g_max - h_loss)
 
         # Make v_loss the same as h_loss
         v_loss = h_loss
 
         # Complete specs dict. with angle/loss data
+        angles = angles.tolist()
         self.specs['h_pattern_datapoint']['phi'] = angles
         self.specs['h_pattern_datapoint']['loss'] = h_loss
 
@@ -150,13 +194,14 @@ class ITUF1245(BaseAntenna):
 
         Keyword Args
         ------------
-        off_axis_angle (int or float) :
+        off_axis_angle (int, float or array_like) :
             Off-axis angle (degrees) (0 <= off_axis_angle <= 180)
 
         Returns
         -------
-        int or float
-            Antenna gain (dBi) at given off-axis angle
+        int, float or numpy.ndarray
+            Antenna gain (dBi) at given off-axis angle; for an array of
+            off-axis angles, the same as gain_batch()
 
         Notes
         -----
@@ -165,7 +210,7 @@ class ITUF1245(BaseAntenna):
 
         # Define expected keys and their types
         required_keys = {
-            "off_axis_angle": (int, float),  # Accept int or float for azimuth
+            "off_axis_angle": (int, float, list, tuple, np.ndarray),  # Accept int or float, or their array for azimuth
         }
 
         # Check if all required keys are present
@@ -179,17 +224,65 @@ class ITUF1245(BaseAntenna):
             if not isinstance(value, expected_types):
                 raise TypeError(f"Key '{key}' must be of type {expected_types}, got {type(value).__name__}")
 
-        # If validation passes, assign values to variables
-        phi = kwargs['off_axis_angle']
+        # If validation passes, compute the gain; an array of angles is
+        # handed over to gain_batch()
+        if isinstance(kwargs['off_axis_angle'], (list, tuple, np.ndarray)):
+            return self.gain_batch(kwargs['off_axis_angle'])
+        return self._gain(kwargs['off_axis_angle'])
 
+
+    def _gain(self, phi):
+        """Compute antenna gain (dBi) without validating the input.
+
+        Parameters
+        ----------
+        phi : int or float
+            off-axis angle (degrees)
+
+        Returns
+        -------
+        int or float
+            Antenna gain (dBi) at the off-axis angle
+        """
         # Bring the angle to expected ranges
         phi = self.__normalize_off_axis_angle(phi)
 
-        # route to appropriate private method for final calc
-        if self.params['calc_opt'] == 'Rec. 2':
-            return self.__gain_rec2(phi)
-        else:
-            return self.__gain_rec3(phi)
+        if phi == 0:
+            return self.params['max_gain_dbi']  # no more computation
+
+        # Find the region of the off-axis angle, then compute the gain
+        region = bisect.bisect_right(self._breakpoints, phi)
+        return self._gain_funcs[region](phi)
+
+
+    def _gain_array(self, phi):
+        """Compute antenna gains (dBi) at given off-axis angles.
+
+        Parameters
+        ----------
+        phi : numpy.ndarray
+            off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) at the off-axis angles
+        """
+        # Bring the angles to expected ranges
+        phi = self.__normalize_off_axis_angles(phi)
+
+        # Find the region of each off-axis angle
+        regions = np.searchsorted(self._breakpoints, phi, side='right')
+
+        # Compute the gains by the formula of each region
+        gains = np.piecewise(
+            phi,
+            [regions == i for i in range(len(self._gain_array_funcs))],
+            self._gain_array_funcs,
+        )
+        gains[phi == 0] = self.params['max_gain_dbi']  # Boresight
+
+        return gains
 
 
     @staticmethod
@@ -206,12 +299,30 @@ class ITUF1245(BaseAntenna):
         int or float
             Azimuth angle (degrees) between 0 and +180
         """
-        angle = (angle % 360 + 360) % 360  # Wrap angle to [0, 360]
+        angle = angle % 360  # Wrap angle to [0, 360)
         if angle > 180:
             angle = 360 - angle  # Mirror to [0, 180]
         return angle
 
     @staticmethod
+    def __normalize_off_axis_angles(angles):
+        """Normalize angles to be between 0 and +180 degrees.
+
+        Parameters
+        ----------
+        angles : array_like
+            off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Off-axis angles (degrees) between 0 and +180
+        """
+        angles = np.mod(np.asarray(angles, dtype=np.float64), 360)  # Wrap angles to [0, 360)
+        return np.where(angles > 180, 360 - angles, angles)  # Mirror to [0, 180]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def __wavelength(frequency):
         """Compute wavelength.
         Parameters
@@ -228,6 +339,7 @@ class ITUF1245(BaseAntenna):
 
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def __d_to_l_from_g_max(g_max):
         """Compute D/l ratio from max antenna gain.
 
@@ -249,6 +361,7 @@ class ITUF1245(BaseAntenna):
 
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def __g_max_from_d_to_l(d_to_l):
         """Compute max antenna gain from D/l ratio.
 
@@ -269,149 +382,132 @@ class ITUF1245(BaseAntenna):
         return 20 * math.log10(d_to_l) + 7.7
 
 
-    def __gain_rec2(self, phi):
-        """Compute antenna gain (dBi) as per [1] Recommends 2.
+    def __gain_rec2(self, lib):
+        """Select gain formulas as per [1] Recommends 2.
 
         Parameters
         ----------
-        phi : int or float
-            off-axis angle (degrees) [0, +180]
+        lib : module
+            math for functions of a scalar angle, numpy for functions
+            of an array of angles
 
         Returns
         -------
-        int or float
-            Antenna gain (dBi) at the off-axis angle
+        tuple
+            A tuple of the following items:
+            - list of off-axis angles (degrees) where each region
+              ends (the first region starts at 0 deg.)
+            - list of functions computing antenna gain (dBi) at the
+              off-axis angle (degrees) for each region
         """
         g_max = self.params['max_gain_dbi']
+        d_to_l = self.params['d_to_l']
+        g_1 = self._g_1
+        phi_m = self._phi_m
+        phi_r = self._phi_r
+        log10 = lib.log10
 
-        if phi == 0:
-            return g_max  # no more computation
+        # Coefficient of phi^2 in the main-lobe formula
+        k_main = 2.5 * 10**-3 * d_to_l**2
 
-        d_to_l = self.params['d_to_l']
-        freq = self.params['freq_band']
-
-        g_1 = 2 + 15 * math.log10(d_to_l)
-        phi_m = 20 * (1 / d_to_l) * math.sqrt(g_max - g_1)
-        phi_r = 12.02 * (d_to_l**(-0.6))
-
-        if (d_to_l > 100) and (freq == '1-70 GHz'):
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10**-3 * (d_to_l * phi)**2
-            elif phi_m <= phi < (max(phi_m, phi_r)):
-                return g_1
-            elif (max(phi_m, phi_r)) <= phi < 48:
-                return 29 - 25 * math.log10(phi)
-            elif 48 <= phi <= 180:
-                return -13
-        elif (d_to_l > 100) and (freq == '70-86 GHz'):
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10**-3 * (d_to_l * phi)**2
-            elif phi_m <= phi < (max(phi_m, phi_r)):
-                return g_1
-            elif (max(phi_m, phi_r)) <= phi < 120:
-                return 29 - 25 * math.log10(phi)
-            elif 120 <= phi <= 180:
-                return -23
-        elif (d_to_l <= 100) and (freq == '1-70 GHz'):
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10**-3 * (d_to_l * phi)**2
-            elif phi_m <= phi < 48:
-                return 39 - 5 * math.log10(d_to_l) - 25 * math.log10(phi)
-            elif 48 <= phi <= 180:
-                return -3 - 5 * math.log10(d_to_l)
-        elif (d_to_l <= 100) and (freq == '70-86 GHz'):
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10**-3 * (d_to_l * phi)**2
-            elif phi_m <= phi < 120:
-                return 39 - 5 * math.log10(d_to_l) - 25 * math.log10(phi)
-            elif 120 <= phi <= 180:
-                return -13 - 5 * math.log10(d_to_l)
-
-    def __gain_rec3(self, phi):
-        """Compute antenna gain (dBi) as per [1] Recommends 3.
+        # Angle where the far side-lobe region starts
+        if self.params['freq_band'] == '1-70 GHz':
+            phi_far = 48
+        else:
+            phi_far = 120
+
+        def g_main(phi):
+            return g_max - k_main * phi * phi
+
+        if d_to_l > 100:
+            if self.params['freq_band'] == '1-70 GHz':
+                g_far = -13
+            else:
+                g_far = -23
+
+            breakpoints = [phi_m, max(phi_m, phi_r), phi_far]
+            funcs = [
+                g_main,
+                lambda phi: g_1,
+                lambda phi: 29 - 25 * log10(phi),
+                lambda phi: g_far,
+            ]
+        else:
+            if self.params['freq_band'] == '1-70 GHz':
+                g_far = -3 - 5 * math.log10(d_to_l)
+            else:
+                g_far = -13 - 5 * math.log10(d_to_l)
+            g_side = 39 - 5 * math.log10(d_to_l)
+
+            breakpoints = [phi_m, phi_far]
+            funcs = [
+                g_main,
+                lambda phi: g_side - 25 * log10(phi),
+                lambda phi: g_far,
+            ]
+
+        return breakpoints, funcs
+
+    def __gain_rec3(self, lib):
+        """Select gain formulas as per [1] Recommends 3.
 
         Parameters
         ----------
-        phi : int or float
-            off-axis angle (degrees) [0, +180]
+        lib : module
+            math for functions of a scalar angle, numpy for functions
+            of an array of angles
 
         Returns
         -------
-        int or float
-            Antenna gain (dBi) at the off-axis angle
+        tuple
+            A tuple of the following items:
+            - list of off-axis angles (degrees) where each region
+              ends (the first region starts at 0 deg.)
+            - list of functions computing antenna gain (dBi) at the
+              off-axis angle (degrees) for each region
         """
         g_max = self.params['max_gain_dbi']
-
-        if phi == 0:
-            return g_max  # no more computation
-
         d_to_l = self.params['d_to_l']
-        freq = self.params['freq_band']
+        g_1 = self._g_1
+        sin_coeff = self._sin_coeff
+        log10, sin = lib.log10, lib.sin
+        maximum = max if lib is math else np.maximum
 
-        if d_to_l > 100:
-            g_a = g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2
-            g_1 = 2 + 15 * math.log10(d_to_l)
-            phi_r = 15.85 * d_to_l**(-0.6)
-            # It's not clear how arguments of sin function must be calc.
-            # sin_arg = (3 * math.pi * math.radians(phi)
-            #           / (2 * math.radians(phi_r)))
-            sin_arg = math.radians(
-                3 * math.pi * phi
-                / (2 * phi_r)
-            )
-            f_phi = 10 * math.log10(0.9 * math.sin(sin_arg)**2 + 0.1)
-            g_b = g_1 + f_phi
-
-            if freq == '1-70 GHz':
-                if 0 <= phi < phi_r:
-                    return max(g_a, g_b)
+        # Coefficient of phi^2 in the main-lobe formula
+        k_main = 2.5 * 10**(-3) * d_to_l**2
 
-                elif phi_r <= phi < 48:
-                    return 32 - 25 * math.log10(phi) + f_phi
+        def f_phi(phi):
+            return 10 * log10(0.9 * sin(sin_coeff * phi)**2 + 0.1)
 
-                elif 48 <= phi <= 180:
-                    return -10 + f_phi
-            else:
-                if 0 <= phi < phi_r:
-                    return max(g_a, g_b)
-
-                elif phi_r <= phi < 120:
-                    return 32 - 25 * math.log10(phi) + f_phi
+        def g_main(phi):
+            g_a = g_max - k_main * phi * phi
+            g_b = g_1 + f_phi(phi)
+            return maximum(g_a, g_b)
 
-                elif 120 <= phi <= 180:
-                    return -20 + f_phi
+        # Angle where the far side-lobe region starts
+        if self.params['freq_band'] == '1-70 GHz':
+            phi_far = 48
         else:
-            g_a = g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2
-            g_1 = 2 + 15 * math.log10(d_to_l)
-            phi_r = 39.8 * d_to_l**(-0.8)
-
-            # It's not clear how arguments of sin function must be calc.
-            # sin_arg = 3 * math.pi * math.radians(phi) \
-            #           / (2 * math.radians(phi_r))
-            sin_arg = math.radians(
-                    3 * math.pi * phi
-                    / (2 * phi_r)
-            )
-            f_phi = 10 * math.log10(0.9 * math.sin(sin_arg)**2 + 0.1)
-            g_b = g_1 + f_phi
+            phi_far = 120
 
-            if freq == '1-70 GHz':
-                if 0 <= phi < phi_r:
-                    return max(g_a, g_b)
-
-                elif phi_r <= phi < 48:
-                    return 42 - 5 * math.log10(d_to_l) \
-                        - 25 * math.log10(phi) + f_phi
-
-                elif 48 <= phi <= 180:
-                    return -5 * math.log10(d_to_l) + f_phi
+        if d_to_l > 100:
+            g_side = 32
+            if self.params['freq_band'] == '1-70 GHz':
+                g_far = -10
+            else:
+                g_far = -20
+        else:
+            g_side = 42 - 5 * math.log10(d_to_l)
+            if self.params['freq_band'] == '1-70 GHz':
+                g_far = -5 * math.log10(d_to_l)
             else:
-                if 0 <= phi < phi_r:
-                    return max(g_a, g_b)
+                g_far = -10 - 5 * math.log10(d_to_l)
 
-                elif phi_r <= phi < 120:
-                    return 42 - 5 * math.log10(d_to_l) \
-                        - 25 * math.log10(phi) + f_phi
+        breakpoints = [self._phi_r, phi_far]
+        funcs = [
+            g_main,
+            lambda phi: g_side - 25 * log10(phi) + f_phi(phi),
+            lambda phi: g_far + f_phi(phi),
+        ]
 
-                elif 120 <= phi <= 180:
-                    return -10 - 5 * math.log10(d_to_l) + f_phi
\ No newline at end of file
+        return breakpoints, funcs
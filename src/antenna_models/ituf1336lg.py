@@ -7,7 +7,9 @@ References:
 """
 
 
+import bisect
 import math
+import numpy as np
 from base import BaseAntenna
 
 
@@ -38,7 +40,23 @@ class ITUF1336lg(BaseAntenna):
 
         This method runs after set_params() of the superclass.
         """
-        pass  # done intentionally, i.e. not needed
+        # ~ Calculate constants of the gain formulas ~
+
+        g_0 = self.params['max_gain_dbi']
+        self._phi_3 = math.sqrt(27000 * 10**(-0.1 * g_0))
+        self._phi_main = 1.08 * self._phi_3  # where the main lobe ends
+        self._phi_1 = 1.9 * self._phi_3
+        self._phi_2 = self._phi_1 * 10**((g_0 - 6) / 32)
+
+        # Angles where the gain formulas switch over; the side-lobe
+        # region is empty if phi_2 is below phi_1
+        self._breakpoints = [
+            self._phi_main, self._phi_1, max(self._phi_1, self._phi_2),
+        ]
+
+        # Select the gain formulas for scalar and array angles
+        self._gain_funcs = self.__gain_funcs(math)
+        self._gain_array_funcs = self.__gain_funcs(np)
 
 
     def _update_specs(self):
@@ -50,8 +68,7 @@ class ITUF1336lg(BaseAntenna):
         self.specs['make'] = 'ITU'
         self.specs['frequency'] = self.params['oper_freq_mhz']
         # Calculate 3 dB beamwidth in azimuth and elevation planes
-        g_0 = self.params['max_gain_dbi']
-        phi_3 = math.sqrt(27000 * 10**(-0.1 * g_0))
+        phi_3 = self._phi_3
         self.specs['h_width'] = round(phi_3, 2)
         self.specs['v_width'] = round(phi_3, 2)  # same as for h_width
         self.specs['front_to_back'] = 'n/a'
@@ -61,17 +78,15 @@ class ITUF1336lg(BaseAntenna):
         self.specs['comment'] = comment_str
 
         # Generate angles from 0 to 360 (inclusive)
-        angles = [i for i in range(0, 361)]
-
-        # Create empty lists for h_loss
-        h_loss = []
+        angles = list(range(361))
 
         g_max = self.params['max_gain_dbi']  # for attenuation calc.
 
-        # Calculate h_loss array's values
-        for angle in angles:
-            # calc. gain, then attenuation, then append
-            h_loss.append(round(g_max - self.gain(off_axis_angle=angle), 2))
+        # The pattern is symmetric, so calculate gains for 0..180 deg.
+        # at once, then attenuation, and mirror it to 181..360 deg.
+        h_loss = self._gain_array(np.arange(181))
+        h_loss = self._round_losses(g_max - h_loss)
+        h_loss = np.concatenate([h_loss, h_loss[-2::-1]])
 
         # Make v_loss the same as h_loss
         v_loss = h_loss
@@ -93,13 +108,14 @@ class ITUF1336lg(BaseAntenna):
 
         Keyword Args
         ------------
-        off_axis_angle (int or float) :
+        off_axis_angle (int, float or array_like) :
             Off-axis angle (degrees) (0 <= off_axis_angle <= 180)
 
         Returns
         -------
-        int or float
-            Antenna gain (dBi) at given off-axis angle
+        int, float or numpy.ndarray
+            Antenna gain (dBi) at given off-axis angle; for an array of
+            off-axis angles, the same as gain_batch()
 
         Notes
         -----
@@ -108,7 +124,7 @@ class ITUF1336lg(BaseAntenna):
 
         # Define expected keys and their types
         required_keys = {
-            "off_axis_angle": (int, float),  # Accept int or float for azimuth
+            "off_axis_angle": (int, float, list, tuple, np.ndarray),  # Accept int or float, or their array for azimuth
         }
 
         # Check if all required keys are present
@@ -122,25 +138,105 @@ class ITUF1336lg(BaseAntenna):
             if not isinstance(value, expected_types):
                 raise TypeError(f"Key '{key}' must be of type {expected_types}, got {type(value).__name__}")
 
-        # If validation passes, assign values to variables
-        theta = kwargs['off_axis_angle']
+        # If validation passes, compute the gain; an array of angles is
+        # handed over to gain_batch()
+        if isinstance(kwargs['off_axis_angle'], (list, tuple, np.ndarray)):
+            return self.gain_batch(kwargs['off_axis_angle'])
+        return self._gain(kwargs['off_axis_angle'])
+
+
+    def _gain(self, theta):
+        """Compute antenna gain (dBi) without validating the input.
+
+        Parameters
+        ----------
+        theta : int or float
+            off-axis angle (degrees)
 
+        Returns
+        -------
+        int or float
+            Antenna gain (dBi) at the off-axis angle
+        """
         # Bring the angle to expected ranges
         theta = self.__normalize_off_axis_angle(theta)
 
+        # Find the region of the off-axis angle, then compute the gain
+        region = bisect.bisect_right(self._breakpoints, theta)
+        return self._gain_funcs[region](theta)
+
+
+    def _gain_array(self, theta):
+        """Compute antenna gains (dBi) at given off-axis angles.
+
+        Parameters
+        ----------
+        theta : array_like
+            off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) at the off-axis angles
+        """
+        # Bring the angles to expected ranges
+        theta = self.__normalize_off_axis_angles(theta)
+
+        # Find the region of each off-axis angle
+        regions = np.searchsorted(self._breakpoints, theta, side='right')
+
+        # Compute the gains by the formula of each region
+        return np.piecewise(
+            theta,
+            [regions == i for i in range(len(self._gain_array_funcs))],
+            self._gain_array_funcs,
+        )
+
+
+    def __gain_funcs(self, lib):
+        """Select gain formulas as per [1] Recommends 4.
+
+        Parameters
+        ----------
+        lib : module
+            math for functions of a scalar angle, numpy for functions
+            of an array of angles
+
+        Returns
+        -------
+        list
+            Functions computing antenna gain (dBi) at the off-axis
+            angle (degrees) for each region between the breakpoints
+        """
         g_0 = self.params['max_gain_dbi']
-        phi_3 = math.sqrt(27000 * 10**(-0.1 * g_0))
-        phi_1 = 1.9 * phi_3
-        phi_2 = phi_1 * 10**((g_0 - 6) / 32)
+        phi_3 = self._phi_3
+        phi_1 = self._phi_1
+        log10 = lib.log10
+
+        return [
+            lambda theta: g_0 - 12 * (theta / phi_3)**2,
+            lambda theta: g_0 - 14,
+            lambda theta: g_0 - 14 - 32 * log10(theta / phi_1),
+            lambda theta: -8,
+        ]
+
 
-        if 0 <= theta < (1.08 * phi_3):
-            return g_0 - 12 * (theta / phi_3)**2
-        elif (1.08 * phi_3) <= theta < phi_1:
-            return g_0 - 14
-        elif phi_1 <= theta < phi_2:
-            return g_0 - 14 - 32 * math.log10(theta / phi_1)
-        elif phi_2 <= theta <= 180:
-            return -8
+    @staticmethod
+    def __normalize_off_axis_angles(angles):
+        """Normalize angles to be between 0 and +180 degrees.
+
+        Parameters
+        ----------
+        angles : array_like
+            off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Off-axis angles (degrees) between 0 and +180
+        """
+        angles = np.mod(np.asarray(angles, dtype=np.float64), 360)  # Wrap angles to [0, 360)
+        return np.where(angles > 180, 360 - angles, angles)  # Mirror to [0, 180]
 
 
     @staticmethod
@@ -157,7 +253,7 @@ class ITUF1336lg(BaseAntenna):
         int or float
             Azimuth angle (degrees) between 0 and +180
         """
-        angle = (angle % 360 + 360) % 360  # Wrap angle to [0, 360]
+        angle = angle % 360  # Wrap angle to [0, 360)
         if angle > 180:
             angle = 360 - angle  # Mirror to [0, 180]
         return angle
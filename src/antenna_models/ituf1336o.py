@@ -8,6 +8,7 @@ References:
 
 
 import math
+import numpy as np
 from base import BaseAntenna
 
 
@@ -102,6 +103,26 @@ class ITUF1336o(BaseAntenna):
             else:
                 self.params['k'] = 0  # Ref. to [1] Recommends 2.4
 
+        # ~ Calculate constants of the gain formulas ~
+
+        g_0 = self.params['max_gain_dbi']
+        k = self.params['k']
+        theta_3 = self.params['beamwidth_el_deg']
+        log_k = math.log10(k + 1)
+        self._theta_4 = theta_3 * math.sqrt(1 - 1 / 1.2 * log_k)
+        self._theta_5 = theta_3 * math.sqrt(1.25 - 1 / 1.2 * log_k)
+        # Gains between the main lobe and far side-lobes
+        self._g_mid_peak = g_0 - 12 + 10 * log_k
+        self._g_mid_average = g_0 - 15 + 10 * log_k
+
+        # Select the gain formulas of the side-lobe pattern type
+        if self.params['pattern_type'] == 'peak':
+            self._gain_func = self.__gain_peak
+            self._gain_array_func = self.__gain_peak_array
+        else:  # follow 'average' root
+            self._gain_func = self.__gain_average
+            self._gain_array_func = self.__gain_average_array
+
 
     def _update_specs(self):
         """Update specs data."""
@@ -126,20 +147,20 @@ class ITUF1336o(BaseAntenna):
         self.specs['comment'] = comment_str
 
         # Generate angles from 0 to 360 (inclusive)
-        angles = [i for i in range(0, 361)]
-
-        # Create empty lists for h_loss and v_loss
-        h_loss = []
-        v_loss = []
+        angles = list(range(361))
 
         g_max = self.params['max_gain_dbi']  # for attenuation calc.
 
-        # Calculate h_loss and v_loss arrays' values
-        for angle in angles:
-            # calc. gain, then attenuation, then append
-            h_loss.append(round(g_max - self.gain(elevation=0), 2))
-            # calc. gain, then attenuation, then append
-            v_loss.append(round(g_max - self.gain(elevation=angle), 2))
+        # Calculate h_loss, which is the same in all azimuths
+        h_loss = np.full(len(angles), round(g_max - self._gain(0), 2))
+
+        # All angles fold to elevations of -90..90 deg., so calculate
+        # gains for those at once, then attenuation, then pick values
+        # of the folded angles
+        v_loss = self._gain_array(np.arange(-90, 91))
+        v_loss = self._round_losses(g_max - v_loss)
+        folded = self.__normalize_elevation_array(angles).astype(int)
+        v_loss = v_loss[folded + 90]
 
         # Complete specs dict. with angle/loss data
         self.specs['h_pattern_datapoint']['phi'] = angles
@@ -154,14 +175,15 @@ class ITUF1336o(BaseAntenna):
 
         Keyword Args
         ------------
-        elevation (int or float):
+        elevation (int, float or array_like):
             elevation angle (degrees) measured from the horizontal
             plane at the site of the antenna(–90 <= theta <= 90)
 
         Returns
         -------
-        int or float
-            Antenna gain (dBi) at given elevation angle
+        int, float or numpy.ndarray
+            Antenna gain (dBi) at given elevation angle; for an array of
+            elevation angles, the same as gain_batch()
 
         Notes
         -----
@@ -170,7 +192,7 @@ class ITUF1336o(BaseAntenna):
         - Recommends 2.2 (average side-lobe patterns).
         """
         required_keys = {
-            "elevation": (int, float),  # Accept int or float for elevation
+            "elevation": (int, float, list, tuple, np.ndarray),  # Accept int or float, or their array for elevation
         }
 
         # Check if all required keys are present
@@ -184,20 +206,57 @@ class ITUF1336o(BaseAntenna):
             if not isinstance(value, expected_types):
                 raise TypeError(f"Key '{key}' must be of type {expected_types}, got {type(value).__name__}")
 
-        # If validation passes, assign values to variables
-        elevation = kwargs['elevation']
+        # If validation passes, compute the gain; an array of angles is
+        # handed over to gain_batch()
+        if isinstance(kwargs['elevation'], (list, tuple, np.ndarray)):
+            return self.gain_batch(kwargs['elevation'])
+        return self._gain(kwargs['elevation'])
+
+
+    def _gain(self, elevation):
+        """Compute antenna gain (dBi) without validating the input.
+
+        Parameters
+        ----------
+        elevation : int or float
+            elevation angle (degrees)
 
+        Returns
+        -------
+        int or float
+            Antenna gain (dBi) at the elevation angle
+        """
         # Bring angles to expected ranges
         theta_h = self.__normalize_elevation(elevation)
 
         # Find equivalent angles for tilted antenna
         theta = self.__normalize_tilted_angles(theta_h)
 
-        # select appropriate method for final return
-        if self.params['pattern_type'] == 'peak':
-            return self.__gain_peak(theta)
-        else:
-            return self.__gain_average(theta)
+        # Compute the gain by the formulas selected in _post_set_params()
+        return self._gain_func(theta)
+
+
+    def _gain_array(self, elevation):
+        """Compute antenna gains (dBi) at given elevations.
+
+        Parameters
+        ----------
+        elevation : array_like
+            elevation angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) at the elevation angles
+        """
+        # Bring angles to expected ranges
+        theta_h = self.__normalize_elevation_array(elevation)
+
+        # Find equivalent angles for tilted antenna
+        theta = self.__normalize_tilted_angles_array(theta_h)
+
+        # Compute the gains by the formulas selected in _post_set_params()
+        return self._gain_array_func(theta)
 
 
     @staticmethod
@@ -214,12 +273,30 @@ class ITUF1336o(BaseAntenna):
         int or float
             Elevation angle (degrees) between -90 and +90
         """
-        while angle > 90 or angle < -90:
-            if angle > 90:
-                angle = 180 - angle
-            elif angle < -90:
-                angle = -180 - angle
-        return angle
+        # Shift angle to [0, 360), then fold it back to [-90, 90]
+        angle = (angle + 90) % 360
+        if angle <= 180:
+            return angle - 90
+        return 270 - angle
+
+
+    @staticmethod
+    def __normalize_elevation_array(angles):
+        """Normalize angles to be between -90 and +90.
+
+        Parameters
+        ----------
+        angles : array_like
+            Elevation angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Elevation angles (degrees) between -90 and +90
+        """
+        # Shift angles to [0, 360), then fold them back to [-90, 90]
+        angles = np.mod(np.asarray(angles, dtype=np.float64) + 90, 360)
+        return np.where(angles <= 180, angles - 90, 270 - angles)
 
 
     def __normalize_tilted_angles(self, theta_h):
@@ -255,7 +332,44 @@ class ITUF1336o(BaseAntenna):
         else:
             theta = 90 * theta_h_beta / (90 - beta)
 
-        return theta
+        # Floating-point rounding may put +/-90 deg. a bit beyond the
+        # range of the gain formulas (e.g. for beta=-86.7)
+        return max(-90, min(90, theta))
+
+
+    def __normalize_tilted_angles_array(self, theta_h):
+        """Modify elevation angles of tilted antenna.
+
+        Parameters
+        ----------
+        theta_h : numpy.ndarray
+            Elevation angles (degree) measured from the horizontal
+            plane at the site of antenna
+
+        Returns
+        -------
+        numpy.ndarray
+            modified theta_h (degrees)
+
+        Notes
+        -----
+        Modification is done as per [1] Recommends 2.5
+        """
+        # Return unmodified theta if 0-tilt angle or none-tilt type
+        if (self.params['tilt_type'] == 'none'
+                or self.params['tilt_angle_deg'] == 0):
+            return theta_h
+
+        beta = self.params['tilt_angle_deg']
+
+        # Calculate modified theta as per [1] formula (1e)
+        theta_h_beta = theta_h + beta
+        theta = np.where(theta_h_beta >= 0,
+                         90 * theta_h_beta / (90 + beta),
+                         90 * theta_h_beta / (90 - beta))
+
+        # Keep the angles within -90..90 deg. as in the scalar case
+        return np.clip(theta, -90, 90)
 
 
     def __gain_peak(self, theta):
@@ -283,14 +397,19 @@ class ITUF1336o(BaseAntenna):
         k = self.params['k']
         theta_3 = self.params['beamwidth_el_deg']
 
-        theta_4 = theta_3 * math.sqrt(1 - 1 / 1.2 * math.log10(k + 1))
-        theta_abs = math.fabs(theta)
+        theta_4 = self._theta_4
+        theta_abs = abs(theta)
 
-        if 0 <= theta_abs < theta_4:
+        # Each branch only checks the upper bound of its region, as the
+        # lower one is implied by the preceding branches
+        if theta_abs < theta_4:
             return g_0 - 12 * ((theta / theta_3)**2)
-        elif theta_4 <= theta_abs < theta_3:
-            return g_0 - 12 + 10 * math.log10(k + 1)
-        elif theta_3 <= theta_abs <= 90:
+        elif theta_abs < theta_3:
+            return self._g_mid_peak
+        else:
+            if k == 0:
+                # 10*log10(x**-1.5) simplified to -15*log10(x)
+                return g_0 - 12 - 15 * math.log10(theta_abs / theta_3)
             return g_0 - 12 + 10 * math.log10((theta_abs / theta_3)**-1.5 + k)
 
 
@@ -319,12 +438,109 @@ class ITUF1336o(BaseAntenna):
         k = self.params['k']
         theta_3 = self.params['beamwidth_el_deg']
 
-        theta_5 = theta_3 * math.sqrt(1.25 - 1 / 1.2 * math.log10(k + 1))
-        theta_abs = math.fabs(theta)
+        theta_5 = self._theta_5
+        theta_abs = abs(theta)
 
-        if 0 <= theta_abs < theta_3:
+        # Each branch only checks the upper bound of its region, as the
+        # lower one is implied by the preceding branches
+        if theta_abs < theta_3:
             return g_0 - 12 * ((theta / theta_3)**2)
-        elif theta_3 <= theta_abs < theta_5:
-            return g_0 - 15 + 10 * math.log10(k + 1)
-        elif theta_5 <= theta_abs <= 90:
+        elif theta_abs < theta_5:
+            return self._g_mid_average
+        else:
+            if k == 0:
+                # 10*log10(x**-1.5) simplified to -15*log10(x)
+                return g_0 - 15 - 15 * math.log10(theta_abs / theta_3)
             return g_0 - 15 + 10 * math.log10((theta_abs / theta_3)**-1.5 + k)
+
+
+    def __gain_peak_array(self, theta):
+        """Compute antenna gains (dBi) in given elevation angles
+
+        Array counterpart of __gain_peak().
+
+        Parameters
+        ----------
+        theta : numpy.ndarray
+            Elevation angles relative to the angle of the maximum gain
+            in the vertical plane (degrees)(–90 <= theta <= 90)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi)
+        """
+        g_0 = self.params['max_gain_dbi']
+        k = self.params['k']
+        theta_3 = self.params['beamwidth_el_deg']
+
+        theta_4 = self._theta_4
+        theta_abs = np.abs(theta)
+
+        # Far side-lobe formula, 10*log10(x**-1.5) is -15*log10(x) if k=0
+        if k == 0:
+            def g_far(t):
+                return g_0 - 12 - 15 * np.log10(t / theta_3)
+        else:
+            def g_far(t):
+                return g_0 - 12 + 10 * np.log10((t / theta_3)**-1.5 + k)
+
+        # Regions of the angles in the same order as in __gain_peak()
+        main_lobe = theta_abs < theta_4
+        shoulder = ~main_lobe & (theta_abs < theta_3)
+
+        return np.piecewise(
+            theta_abs,
+            [main_lobe, shoulder],
+            [
+                lambda t: g_0 - 12 * ((t / theta_3)**2),
+                self._g_mid_peak,
+                g_far,
+            ],
+        )
+
+
+    def __gain_average_array(self, theta):
+        """Compute antenna gains (dBi) in given elevation angles
+
+        Array counterpart of __gain_average().
+
+        Parameters
+        ----------
+        theta : numpy.ndarray
+            Elevation angles relative to the angle of the maximum gain
+            in the vertical plane (degrees)(–90 <= theta <= 90)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi)
+        """
+        g_0 = self.params['max_gain_dbi']
+        k = self.params['k']
+        theta_3 = self.params['beamwidth_el_deg']
+
+        theta_5 = self._theta_5
+        theta_abs = np.abs(theta)
+
+        # Far side-lobe formula, 10*log10(x**-1.5) is -15*log10(x) if k=0
+        if k == 0:
+            def g_far(t):
+                return g_0 - 15 - 15 * np.log10(t / theta_3)
+        else:
+            def g_far(t):
+                return g_0 - 15 + 10 * np.log10((t / theta_3)**-1.5 + k)
+
+        # Regions of the angles in the same order as in __gain_average()
+        main_lobe = theta_abs < theta_3
+        shoulder = ~main_lobe & (theta_abs < theta_5)
+
+        return np.piecewise(
+            theta_abs,
+            [main_lobe, shoulder],
+            [
+                lambda t: g_0 - 12 * ((t / theta_3)**2),
+                self._g_mid_average,
+                g_far,
+            ],
+        )
@@ -8,6 +8,7 @@ References:
 
 
 import math
+import numpy as np
 from base import BaseAntenna
 
 
@@ -152,6 +153,56 @@ class ITUF1336s(BaseAntenna):
             else:
                 self.params['k_v'] = 0.3  # default for improved
 
+        # Cos and Sin of the tilt angle for the tilt transforms
+        beta_rad = math.radians(self.params['tilt_angle_deg'])
+        self._cos_beta = math.cos(beta_rad)
+        self._sin_beta = math.sin(beta_rad)
+
+        # ~ Calculate constants of the 0.4-6 GHz gain formulas ~
+
+        if self.params['freq_range'] == '0.4-6 GHz':
+            k_h = self.params['k_h']
+            k_v = self.params['k_v']
+            phi_3 = self.params['beamwidth_az_deg']
+
+            if self.params['pattern_type'] == 'peak':
+                self._g_180 = self.__g_180_peak()
+                self._c = self.__c_peak()
+                self._x_k = math.sqrt(1 - 0.36 * k_v)
+                g_hr = self.__g_hr_peak
+            else:
+                self._g_180 = self.__g_180_average()
+                self._c = self.__c_average()
+                self._x_k = math.sqrt(1.33 - 0.33 * k_v)
+                g_hr = self.__g_hr_average
+
+            self._lambda_kh = 3 * (1 - 0.5**-k_h)
+            self._hr_exponent = 2 - k_h  # of the far azimuth formula
+            # 4**-1.5 = 0.125
+            self._lambda_kv = (12 - self._c * math.log10(4)
+                               - 10 * math.log10(0.125 + k_v))
+
+            # Terms of the horizontal gain compression ratio
+            self._g_hr_180 = g_hr(180 / phi_3)
+            self._g_hr_range = g_hr(0) - self._g_hr_180
+
+        # ~ Select the gain functions of the band and pattern type ~
+
+        if self.params['freq_range'] == '0.4-6 GHz':
+            # re-direction based on pattern type
+            if self.params['pattern_type'] == 'average':
+                self._gain_func = self.__gain_average_04_6ghz
+            else:  # follow 'peak' root
+                self._gain_func = self.__gain_peak_04_6ghz
+            self._gain_array_func = self.__gain_04_6ghz_array
+        else:  # follow '6-70 GHz' root
+            # re-direction based on pattern type
+            if self.params['pattern_type'] == 'average':
+                self._gain_func = self.__gain_average_6_70ghz
+            else:  # follow 'peak' root
+                self._gain_func = self.__gain_peak_6_70ghz
+            self._gain_array_func = self.__gain_6_70ghz_array
+
 
     def _update_specs(self):
         """Update specs data."""
@@ -179,25 +230,31 @@ class ITUF1336s(BaseAntenna):
         self.specs['comment'] = comment_str
 
         # Generate angles from 0 to 360 (inclusive)
-        angles = [i for i in range(0, 361)]
-
-        # Create empty lists for h_loss and v_loss
-        h_loss = []
-        v_loss = []
+        angles = list(range(361))
 
         g_max = self.params['max_gain_dbi']  # for attenuation calc.
 
-        # Calculate h_loss and v_loss arrays' values
-        for angle in angles:
-            # calc. gain, then attenuation, then append
-            h_loss.append(round(g_max - self.gain(azimuth=angle, elevation=0), 2))
-            # need the azimuth to point back when elevation points back
-            if 90 < angle < 270:
-                phi = 180
-            else:
-                phi = 0
-            # calc. gain, then attenuation, then append
-            v_loss.append(round(g_max - self.gain(azimuth=phi, elevation=angle), 2))
+        # The azimuth pattern depends on the azimuth only through its
+        # cosine or absolute value, so only 0..180 deg. are calculated
+        h_phi = np.arange(181)
+        h_theta = np.zeros(181)
+
+        # The elevation pattern of not tilted antenna is symmetric too
+        v_mirrored = self.params['tilt_type'] == 'none'
+        v_theta = np.arange(181 if v_mirrored else 361)
+        # need the azimuth to point back when elevation points back
+        v_phi = np.where((90 < v_theta) & (v_theta < 270), 180, 0)
+
+        # Calculate gains of both patterns at once, then attenuation
+        loss = self._gain_array(np.concatenate([h_phi, v_phi]),
+                                np.concatenate([h_theta, v_theta]))
+        loss = self._round_losses(g_max - loss)
+        h_loss, v_loss = loss[:181], loss[181:]
+
+        # Mirror the calculated halves to 181..360 deg.
+        h_loss = np.concatenate([h_loss, h_loss[-2::-1]])
+        if v_mirrored:
+            v_loss = np.concatenate([v_loss, v_loss[-2::-1]])
 
         # Complete specs dict. with angle/loss data
         self.specs['h_pattern_datapoint']['phi'] = angles
@@ -227,17 +284,18 @@ class ITUF1336s(BaseAntenna):
 
         Keyword Args
         ------------
-        azimuth (int or float) :
+        azimuth (int, float or array_like) :
             Azimuth angle (degrees) in the horizontal plane at the
             site of the antenna measured from the azimuth of maximum gain
-        elevation (int or float) :
+        elevation (int, float or array_like) :
             Elevation angle (degree) measured from the horizontal plane
             at the site of antenna
 
         Returns
         -------
-        int or float
-            Antenna gain (dBi) at given azimuth and elevation
+        int, float or numpy.ndarray
+            Antenna gain (dBi) at given azimuth and elevation; for
+            arrays of angles, the same as gain_batch()
 
         Notes
         -----
@@ -251,8 +309,8 @@ class ITUF1336s(BaseAntenna):
 
         # Define expected keys and their types
         required_keys = {
-            "azimuth": (int, float),  # Accept int or float for azimuth
-            "elevation": (int, float)  # Accept int or float for elevation
+            "azimuth": (int, float, list, tuple, np.ndarray),  # Accept int or float, or their array for azimuth
+            "elevation": (int, float, list, tuple, np.ndarray)  # Accept int or float, or their array for elevation
         }
 
         # Check if all required keys are present
@@ -266,31 +324,75 @@ class ITUF1336s(BaseAntenna):
             if not isinstance(value, expected_types):
                 raise TypeError(f"Key '{key}' must be of type {expected_types}, got {type(value).__name__}")
 
-        # If validation passes, assign values to variables
-        azimuth = kwargs['azimuth']
-        elevation = kwargs['elevation']
+        # If validation passes, compute the gain; arrays of angles are
+        # handed over to gain_batch()
+        azimuth, elevation = kwargs['azimuth'], kwargs['elevation']
+        if (isinstance(azimuth, (list, tuple, np.ndarray))
+                or isinstance(elevation, (list, tuple, np.ndarray))):
+            return self.gain_batch(azimuth, elevation)
+        return self._gain(azimuth, elevation)
+
+
+    def _gain(self, azimuth, elevation):
+        """Compute antenna gain (dBi) without validating the input.
 
+        Parameters
+        ----------
+        azimuth : int or float
+            Azimuth angle (degrees) in the horizontal plane at the
+            site of the antenna measured from the azimuth of maximum gain
+        elevation : int or float
+            Elevation angle (degree) measured from the horizontal plane
+            at the site of antenna
+
+        Returns
+        -------
+        int or float
+            Antenna gain (dBi) at the azimuth and elevation
+        """
         # Bring angles to expected ranges
         phi_h = self.__normalize_azimuth(azimuth)
         theta_h = self.__normalize_elevation(elevation)
 
         # Find equivalent angles for tilted antenna
         angles = self.__normalize_tilted_angles(phi_h, theta_h)
-        phi = angles['phi']
-        theta = angles['theta']
 
-        if self.params['freq_range'] == '0.4-6 GHz':
-            # re-direction based on pattern type
-            if self.params['pattern_type'] == 'average':
-                return self.__gain_average_04_6ghz(phi, theta)
-            else:  # follow 'peak' root
-                return self.__gain_peak_04_6ghz(phi, theta)
-        else:  # follow '6-70 GHz' root
-            # re-direction based on pattern type
-            if self.params['pattern_type'] == 'average':
-                return self.__gain_average_6_70ghz(phi, theta)
-            else:  # follow 'peak' root
-                return self.__gain_peak_6_70ghz(phi, theta)
+        # Compute the gain by the function selected in set_params()
+        return self._gain_func(angles['phi'], angles['theta'])
+
+
+    def _gain_array(self, azimuth, elevation):
+        """Compute antenna gains (dBi) at given azimuths and elevations.
+
+        Parameters
+        ----------
+        azimuth : array_like
+            Azimuth angles (degrees) in the horizontal plane at the
+            site of the antenna measured from the azimuth of maximum gain
+        elevation : array_like
+            Elevation angles (degree) measured from the horizontal plane
+            at the site of antenna
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) at the azimuths and elevations, which
+            are broadcast against each other
+        """
+        azimuth, elevation = np.broadcast_arrays(
+            np.asarray(azimuth, dtype=np.float64),
+            np.asarray(elevation, dtype=np.float64),
+        )
+
+        # Bring angles to expected ranges
+        phi_h = self.__normalize_azimuth_array(azimuth)
+        theta_h = self.__normalize_elevation_array(elevation)
+
+        # Find equivalent angles for tilted antenna
+        phi, theta = self.__normalize_tilted_angles_array(phi_h, theta_h)
+
+        # Compute the gains by the function selected in set_params()
+        return self._gain_array_func(phi, theta)
 
 
     @staticmethod
@@ -304,13 +406,12 @@ class ITUF1336s(BaseAntenna):
 
         Returns
         -------
-        int or float
+        float
             Azimuth angle (degrees) between -180 and +180
         """
-        angle = angle % 360
-        if angle > 180:
-            angle -= 360
-        return angle
+        # IEEE remainder lies in [-180, 180]; ±180 only differ in sign,
+        # which the gain formulas do not depend on
+        return math.remainder(angle, 360)
 
 
     @staticmethod
@@ -327,12 +428,48 @@ class ITUF1336s(BaseAntenna):
         int or float
             Elevation angle (degrees) between -90 and +90
         """
-        while angle > 90 or angle < -90:
-            if angle > 90:
-                angle = 180 - angle
-            elif angle < -90:
-                angle = -180 - angle
-        return angle
+        # Shift angle to [0, 360), then fold it back to [-90, 90]
+        angle = (angle + 90) % 360
+        if angle <= 180:
+            return angle - 90
+        return 270 - angle
+
+
+    @staticmethod
+    def __normalize_azimuth_array(angles):
+        """Normalize angles to be between -180 and +180 degrees.
+
+        Parameters
+        ----------
+        angles : numpy.ndarray
+            Azimuth angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Azimuth angles (degrees) between -180 and +180
+        """
+        angles = np.mod(angles, 360)
+        return np.where(angles > 180, angles - 360, angles)
+
+
+    @staticmethod
+    def __normalize_elevation_array(angles):
+        """Normalize angles to be between -90 and +90.
+
+        Parameters
+        ----------
+        angles : numpy.ndarray
+            Elevation angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Elevation angles (degrees) between -90 and +90
+        """
+        # Shift angles to [0, 360), then fold them back to [-90, 90]
+        angles = np.mod(angles + 90, 360)
+        return np.where(angles <= 180, angles - 90, 270 - angles)
 
 
     def __normalize_tilted_angles(self, phi_h, theta_h):
@@ -371,22 +508,21 @@ class ITUF1336s(BaseAntenna):
         phi_h_rad = math.radians(phi_h)
         theta_h_rad = math.radians(theta_h)
         beta = self.params['tilt_angle_deg']
-        beta_rad = math.radians(beta)
 
-        # Cos and Sin of angles
+        # Cos and Sin of angles, the ones of beta set in set_params()
         sin_theta_h = math.sin(theta_h_rad)
-        cos_beta = math.cos(beta_rad)
+        cos_beta = self._cos_beta
         cos_theta_h = math.cos(theta_h_rad)
         cos_phi_h = math.cos(phi_h_rad)
-        sin_beta = math.sin(beta_rad)
+        sin_beta = self._sin_beta
 
         # Calculate modified theta and phi for mechanical tilt case
         # Refer to [1] formula (3b)
         asin_arg = sin_theta_h * cos_beta + cos_theta_h * cos_phi_h * sin_beta
         asin_arg = max(-1.0, min(1.0, asin_arg))  # clamp by [-1, 1]
-        theta = math.degrees(math.asin(asin_arg))
+        theta_rad = math.asin(asin_arg)
+        theta = math.degrees(theta_rad)
         # Refer to [1] formula (3c)
-        theta_rad = math.radians(theta)
         cos_theta = math.cos(theta_rad)
         # acos_arg = ((cos_theta_h * cos_phi_h * cos_beta
         #             - sin_theta_h * sin_beta)
@@ -413,6 +549,332 @@ class ITUF1336s(BaseAntenna):
         return {'phi': phi, 'theta': theta}
 
 
+    def __normalize_tilted_angles_array(self, phi_h, theta_h):
+        """Modify azimuth and elevation angles of tilted antenna.
+
+        Array counterpart of __normalize_tilted_angles().
+
+        Parameters
+        ----------
+        phi_h : numpy.ndarray
+            Azimuth angles (degrees) in the horizontal plane at the
+            site of the antenna measured from the azimuth of maximum gain
+        theta_h : numpy.ndarray
+            Elevation angles (degree) measured from the horizontal plane
+            at the site of antenna
+
+        Returns
+        -------
+        tuple
+            Modified phi_h and theta_h (degrees)
+
+        Notes
+        -----
+        Modification is done as per [1] Recommends 3.4 and 3.5
+        """
+        # Return unmodified phi/theta if 0-tilt angle & none-tilt type
+        if (self.params['tilt_type'] == 'none'
+                and self.params['tilt_angle_deg'] == 0):
+            return phi_h, theta_h
+
+        # Convert angles to radians
+        phi_h_rad = np.radians(phi_h)
+        theta_h_rad = np.radians(theta_h)
+        beta = self.params['tilt_angle_deg']
+
+        # Cos and Sin of angles, the ones of beta set in set_params()
+        sin_theta_h = np.sin(theta_h_rad)
+        cos_beta = self._cos_beta
+        cos_theta_h = np.cos(theta_h_rad)
+        cos_phi_h = np.cos(phi_h_rad)
+        sin_beta = self._sin_beta
+
+        # Calculate modified theta and phi for mechanical tilt case
+        # Refer to [1] formula (3b)
+        asin_arg = sin_theta_h * cos_beta + cos_theta_h * cos_phi_h * sin_beta
+        asin_arg = np.clip(asin_arg, -1.0, 1.0)  # clamp by [-1, 1]
+        theta_rad = np.arcsin(asin_arg)
+        theta = np.degrees(theta_rad)
+        # Refer to [1] formula (3c)
+        cos_theta = np.cos(theta_rad)
+        acos_arg = (
+                (
+                        -sin_theta_h * sin_beta
+                        + cos_theta_h * cos_phi_h * cos_beta
+                )
+                / cos_theta
+        )
+        acos_arg = np.clip(acos_arg, -1.0, 1.0)  # clamp by [-1, 1]
+        phi = np.degrees(np.arccos(acos_arg))
+
+        # Re-calculate theta in case of electrical tilt
+        if self.params['tilt_type'] == 'electrical':
+            theta_h_beta = theta_h + beta
+            # Calculate modified theta as per [1] formula (1e)
+            theta = np.where(theta_h_beta >= 0,
+                             90 * theta_h_beta / (90 + beta),
+                             90 * theta_h_beta / (90 - beta))
+
+        return phi, theta
+
+
+    def __gain_04_6ghz_array(self, phi, theta):
+        """Compute antenna gains (dBi) in given directions.
+
+        Array counterpart of __gain_peak_04_6ghz() and
+        __gain_average_04_6ghz().
+
+        Parameters
+        ----------
+        phi : numpy.ndarray
+            Azimuth angles relative to the angle of the maximum gain
+            in the horizontal plane (degrees) (–180 <= phi <= 180)
+        theta : numpy.ndarray
+            Elevation angles relative to the angle of the maximum gain
+            in the vertical plane (degrees)(–90 <= theta <= 90)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi)
+
+        Notes
+        -----
+        Refer to [1] Recommends 3.1.1 and 3.1.2
+        """
+        phi_3 = self.params['beamwidth_az_deg']
+        theta_3 = self.params['beamwidth_el_deg']
+        g_0 = self.params['max_gain_dbi']
+
+        x_h = np.abs(phi) / phi_3  # Ref. [1] Recommends 3.1.1
+        x_v = np.abs(theta) / theta_3  # Ref. [1] Recommends 3.1.1
+
+        g_hr_x_h = self.__g_hr_array(x_h)
+
+        # Fail like the scalar computation, instead of giving NaN
+        if self._g_hr_range == 0:
+            raise ZeroDivisionError('float division by zero')
+
+        # Calculate horizontal gain compression ratio
+        # Ref. [1] Recommends 3.1.1, formula (2a2)
+        r = (g_hr_x_h - self._g_hr_180) / self._g_hr_range
+
+        # Calculate resulting gain Ref. [1] Recommends 3.1.1, 3.1.2
+        return g_0 + g_hr_x_h + r * self.__g_vr_array(x_v)
+
+
+    def __g_hr_array(self, x_h):
+        """Compute relative reference antenna gains in azimuth plane.
+
+        Parameters
+        ----------
+        x_h : numpy.ndarray
+            Ratios of abs(phi) / phi_3
+
+        Returns
+        -------
+        numpy.ndarray
+            Relative reference antenna gains in the azimuth plane
+
+        Notes
+        -----
+        Refer to [1] Recommends 3.1.1.2 and 3.1.2.2
+        """
+        # Ref. to [1] formulas (2b2) and (2c2)
+        return_val = np.where(x_h <= 0.5,
+                              -12 * x_h * x_h,
+                              -12 * x_h**self._hr_exponent - self._lambda_kh)
+
+        return np.maximum(return_val, self._g_180)
+
+
+    def __g_vr_array(self, x_v):
+        """Compute relative reference antenna gains in elevation plane.
+
+        Parameters
+        ----------
+        x_v : numpy.ndarray
+            The ratios of abs(theta)/theta_3
+
+        Returns
+        -------
+        numpy.ndarray
+            Relative reference antenna gains in elevation plane
+
+        Notes
+        -----
+        Refer to [1] Recommends 3.1.1.3 and 3.1.2.3
+        """
+        k_v = self.params['k_v']
+        theta_3 = self.params['beamwidth_el_deg']
+        c = self._c
+        lambda_kv = self._lambda_kv
+
+        if self.params['pattern_type'] == 'peak':
+            g_side = -12  # level of the side-lobe formula
+            g_far = 0  # offset of the far side-lobe formula
+        else:
+            g_side = -15
+            g_far = -3
+
+        # Find the region of each ratio; a region is empty if its
+        # upper bound is below the preceding one
+        regions = np.searchsorted(
+            [self._x_k, 4, max(4, 90 / theta_3)], x_v, side='right'
+        )
+
+        # Ref. to [1] Formulas (2b3) and (2c3)
+        return np.piecewise(
+            x_v,
+            [regions == i for i in range(4)],
+            [
+                lambda x: -12 * x * x,
+                lambda x: g_side + 10 * np.log10(1 / (x * np.sqrt(x)) + k_v),
+                lambda x: -lambda_kv + g_far - c * np.log10(x),
+                self._g_180,
+            ],
+        )
+
+
+    def __gain_6_70ghz_array(self, phi, theta):
+        """Compute antenna gains (dBi) in given directions.
+
+        Array counterpart of __gain_peak_6_70ghz() and
+        __gain_average_6_70ghz().
+
+        Parameters
+        ----------
+        phi : numpy.ndarray
+            Azimuth angles relative to the angle of the maximum gain
+            in the horizontal plane (degrees) (–180 <= phi <= 180)
+        theta : numpy.ndarray
+            Elevation angles relative to the angle of the maximum gain
+            in the vertical plane (degrees)(–90 <= theta <= 90)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi)
+
+        Notes
+        -----
+        Refer to [1] Recommends 3.2.1 and 3.2.2
+        """
+        g_0 = self.params['max_gain_dbi']
+
+        if self.params['pattern_type'] == 'peak':
+            x_th = 1  # Ref. to [1] Formula (2e)
+            g_side = g_0 - 12
+        else:
+            x_th = 1.152  # Ref. to [1] Formula (2f)
+            g_side = g_0 - 15
+
+        # Ref. to [1] Formula (2d4)
+        acos_arg = np.cos(np.radians(phi)) * np.cos(np.radians(theta))
+        acos_arg = np.clip(acos_arg, -1.0, 1.0)  # clamping by [-1, 1]
+        psi = np.degrees(np.arccos(acos_arg))
+
+        psi_a = self.__psi_a_array(phi, theta, psi)  # Formula (2d3)
+
+        x = psi / psi_a  # Ref. to [1] Formula (2d5)
+
+        # Final gain calculation Ref. to [1] Formulas (2e) and (2f)
+        return np.piecewise(
+            x,
+            [x < x_th],
+            [
+                lambda x: g_0 - 12 * x * x,
+                lambda x: g_side - 15 * np.log10(x),
+            ],
+        )
+
+
+    def __psi_a_array(self, phi, theta, psi):
+        """Compute psi_a (degrees).
+
+        Parameters
+        ----------
+        phi : numpy.ndarray
+            Azimuth angles relative to the angle of the maximum gain
+            in the horizontal plane (degrees) (–180 <= phi <= 180)
+        theta : numpy.ndarray
+            Elevation angles relative to the angle of the maximum gain
+            in the vertical plane (degrees)(–90 <= theta <= 90)
+        psi : numpy.ndarray
+            Angles psi (degrees) of the directions
+
+        Returns
+        -------
+        numpy.ndarray
+            Angles psi_a (degrees)
+
+        Notes
+        -----
+        Refer to [1] Recommends 3.2.1
+        """
+        phi_3 = self.params['beamwidth_az_deg']
+        theta_3 = self.params['beamwidth_el_deg']
+
+        psi_a = np.empty_like(psi)
+        front = psi <= 90
+
+        # Ref. to [1] formula (2d2), atan2() is used instead atan()
+        alpha_rad = np.arctan2(np.tan(np.radians(theta[front])),
+                               np.sin(np.radians(phi[front])))
+        a = np.cos(alpha_rad) / phi_3
+        b = np.sin(alpha_rad) / theta_3
+        psi_a[front] = 1 / np.hypot(a, b)
+
+        back = ~front
+        phi_3m = self.__phi_3m_array(phi[back])
+        theta_rad = np.radians(theta[back])
+        a = np.cos(theta_rad) / phi_3m
+        b = np.sin(theta_rad) / theta_3
+        psi_a[back] = 1 / np.hypot(a, b)
+
+        return psi_a
+
+
+    def __phi_3m_array(self, phi):
+        """Compute equivalent 3 dB beamwidths phi_3m (degrees)
+        in the azimuth plane
+
+        Parameters
+        ----------
+        phi : numpy.ndarray
+            Azimuth angles relative to the angle of the maximum gain
+            in the horizontal plane (degrees) (–180 <= phi <= 180)
+
+        Returns
+        -------
+        numpy.ndarray
+            Equivalent 3 dB beamwidths (degrees)
+
+        Notes
+        -----
+        Refer to [1] Recommends 3.2.1
+        """
+        phi_3 = self.params['beamwidth_az_deg']
+        theta_3 = self.params['beamwidth_el_deg']
+        phi_abs = np.abs(phi)
+
+        # Set phi_th depending on peak or average side-lobe pattern
+        if self.params['pattern_type'] == 'peak':
+            phi_th = phi_3   # Ref. to [1] Recommends 3.2.1
+        else:
+            phi_th = 1.152 * phi_3   # Ref. to [1] Recommends 3.2.2
+
+        phi_3m = np.full_like(phi_abs, phi_3)
+        wide = phi_abs > phi_th
+
+        x = np.radians((phi_abs[wide] - phi_th) / (180 - phi_th) * 90)
+        a = np.cos(x) / phi_3
+        b = np.sin(x) / theta_3
+        phi_3m[wide] = 1 / np.hypot(a, b)
+
+        return phi_3m
+
+
     def __gain_peak_04_6ghz(self, phi, theta):
         """Compute antenna gain (dBi) in given direction.
 
@@ -445,14 +907,14 @@ class ITUF1336s(BaseAntenna):
         x_h = math.fabs(phi) / phi_3  # Ref. [1] Recommends 3.1.1
         x_v = math.fabs(theta) / theta_3  # Ref. [1] Recommends 3.1.1
 
+        g_hr_x_h = self.__g_hr_peak(x_h)
+
         # Calculate horizontal gain compression ratio
         # Ref. [1] Recommends 3.1.1, formula (2a2)
-        r = ((self.__g_hr_peak(x_h) - self.__g_hr_peak(180 / phi_3))
-             / (self.__g_hr_peak(0) - self.__g_hr_peak(180 / phi_3)))
+        r = (g_hr_x_h - self._g_hr_180) / self._g_hr_range
 
         # Calculate resulting gain Ref. [1] Recommends 3.1.1
-        return (g_0 + self.__g_hr_peak(x_h)
-                + r * self.__g_vr_peak(x_v))
+        return g_0 + g_hr_x_h + r * self.__g_vr_peak(x_v)
 
 
     def __g_hr_peak(self, x_h):
@@ -472,15 +934,14 @@ class ITUF1336s(BaseAntenna):
         -----
         Refer to [1] Recommends 3.1.1.2
         """
-        k_h = self.params['k_h']
-        lambda_kh = 3 * (1 - 0.5**-k_h)
-        g_180 = self.__g_180_peak()
+        lambda_kh = self._lambda_kh
+        g_180 = self._g_180
 
         # Ref. to [1] Recommends 3.1.1.1.2, formula (2b2)
         if x_h <= 0.5:
-            return_val = -12 * x_h**2
+            return_val = -12 * x_h * x_h
         else:
-            return_val = -12 * x_h**(2 - k_h) - lambda_kh
+            return_val = -12 * x_h**self._hr_exponent - lambda_kh
 
         if return_val >= g_180:
             return return_val
@@ -528,17 +989,16 @@ class ITUF1336s(BaseAntenna):
         k_v = self.params['k_v']
         theta_3 = self.params['beamwidth_el_deg']
 
-        x_k = math.sqrt(1 - 0.36 * k_v)
-        g_180 = self.__g_180_peak()
-        c = self.__c_peak()
-        lambda_kv = (12 - c * math.log10(4)
-                     - 10 * math.log10(4**-1.5 + k_v))
+        x_k = self._x_k
+        g_180 = self._g_180
+        c = self._c
+        lambda_kv = self._lambda_kv
 
         # Ref. to [1] Recommends 3.1.1.3, Formula (2b3)
         if x_v < x_k:
-            return -12 * x_v**2
+            return -12 * x_v * x_v
         elif (x_k <= x_v) and (x_v < 4):
-            return -12 + 10 * math.log10(x_v**-1.5 + k_v)
+            return -12 + 10 * math.log10(1 / (x_v * math.sqrt(x_v)) + k_v)
         elif (4 <= x_v) and (x_v < (90 / theta_3)):
             return -lambda_kv - c * math.log10(x_v)
         elif x_v >= (90 / theta_3):
@@ -562,8 +1022,9 @@ class ITUF1336s(BaseAntenna):
         k_v = self.params['k_v']
         k_p = self.params['k_p']
 
-        block_1 = math.pow(180 / theta_3, 1.5)
-        block_2 = math.pow(4, -1.5) + k_v
+        y = 180 / theta_3
+        block_1 = y * math.sqrt(y)  # y**1.5
+        block_2 = 0.125 + k_v  # 4**-1.5 = 0.125
         block_3 = math.log10(22.5 / theta_3)
 
         return math.log10(block_1 * block_2 / (1 + 8 * k_p)) / block_3
@@ -600,14 +1061,14 @@ class ITUF1336s(BaseAntenna):
         x_h = math.fabs(phi) / phi_3  # Ref. [1] Recommends 3.1.1
         x_v = math.fabs(theta) / theta_3  # Ref. [1] Recommends 3.1.1
 
+        g_hr_x_h = self.__g_hr_average(x_h)
+
         # Calculate horizontal gain compression ratio
         # Ref. [1] Recommends 3.1.1, formula (2a2)
-        r = ((self.__g_hr_average(x_h) - self.__g_hr_average(180 / phi_3))
-             / (self.__g_hr_average(0) - self.__g_hr_average(180 / phi_3)))
+        r = (g_hr_x_h - self._g_hr_180) / self._g_hr_range
 
         # Calculate resulting gain Ref. [1] Recommends 3.1.2
-        return (g_0 + self.__g_hr_average(x_h)
-                + r * self.__g_vr_average(x_v))
+        return g_0 + g_hr_x_h + r * self.__g_vr_average(x_v)
 
 
     def __g_hr_average(self, x_h):
@@ -627,15 +1088,14 @@ class ITUF1336s(BaseAntenna):
         -----
         Refer to [1] Recommends 3.1.2.2
         """
-        k_h = self.params['k_h']
-        lambda_kh = 3 * (1 - 0.5**-k_h)
-        g_180 = self.__g_180_average()
+        lambda_kh = self._lambda_kh
+        g_180 = self._g_180
 
         # Ref. to [1] Recommends 3.1.2.2, formula (2c2)
         if x_h <= 0.5:
-            return_val = -12 * x_h**2
+            return_val = -12 * x_h * x_h
         else:
-            return_val = -12 * x_h **(2 - k_h) - lambda_kh
+            return_val = -12 * x_h**self._hr_exponent - lambda_kh
 
         if return_val >= g_180:
             return return_val
@@ -684,17 +1144,16 @@ class ITUF1336s(BaseAntenna):
         k_v = self.params['k_v']
         theta_3 = self.params['beamwidth_el_deg']
 
-        x_k = math.sqrt(1.33 - 0.33 * k_v)
-        g_180 = self.__g_180_average()
-        c = self.__c_average()
-        lambda_kv = (12 - c * math.log10(4)
-                     - 10 * math.log10(4 ** -1.5 + k_v))
+        x_k = self._x_k
+        g_180 = self._g_180
+        c = self._c
+        lambda_kv = self._lambda_kv
 
         # Ref. to [1] Recommends 3.1.2.3, Formula (2c3)
         if x_v < x_k:
-            return -12 * x_v ** 2
+            return -12 * x_v * x_v
         elif (x_k <= x_v) and (x_v < 4):
-            return -15 + 10 * math.log10(x_v ** -1.5 + k_v)
+            return -15 + 10 * math.log10(1 / (x_v * math.sqrt(x_v)) + k_v)
         elif (4 <= x_v) and (x_v < (90 / theta_3)):
             return -lambda_kv - 3 - c * math.log10(x_v)
         elif x_v >= (90 / theta_3):
@@ -718,8 +1177,9 @@ class ITUF1336s(BaseAntenna):
         k_v = self.params['k_v']
         k_a = self.params['k_a']
 
-        block_1 = math.pow(180 / theta_3, 1.5)
-        block_2 = math.pow(4, -1.5) + k_v
+        y = 180 / theta_3
+        block_1 = y * math.sqrt(y)  # y**1.5
+        block_2 = 0.125 + k_v  # 4**-1.5 = 0.125
         block_3 = math.log10(22.5 / theta_3)
 
         return math.log10(block_1 * block_2 / (1 + 8 * k_a)) / block_3
@@ -753,13 +1213,13 @@ class ITUF1336s(BaseAntenna):
         g_0 = self.params['max_gain_dbi']
 
         psi = self.__psi(phi, theta)  # Ref. to [1] Formula (2d4)
-        psi_a = self.__psi_a(phi, theta)  # Ref. to [1] Formula (2d3)
+        psi_a = self.__psi_a(phi, theta, psi)  # Formula (2d3)
 
         x = psi / psi_a  # Ref. to [1] Formula (2d5)
 
         # Final gain calculation Ref. to [1] Formula (2e)
         if (0 <= x) and (x < 1):
-            return g_0 - 12 * x**2
+            return g_0 - 12 * x * x
         elif 1 <= x:
             return g_0 - 12 - 15 * math.log10(x)
 
@@ -797,7 +1257,7 @@ class ITUF1336s(BaseAntenna):
         return math.degrees(psi_rad)
 
 
-    def __psi_a(self, phi, theta):
+    def __psi_a(self, phi, theta, psi):
         """Compute psi_a (degrees).
 
         Parameters
@@ -808,6 +1268,8 @@ class ITUF1336s(BaseAntenna):
         theta : int or float
             Elevation angle relative to the angle of the maximum gain
             in the vertical plane (degrees)(–90 <= theta <= 90)
+        psi : int or float
+            Angle psi (degrees) of the direction
 
         Returns
         -------
@@ -820,23 +1282,21 @@ class ITUF1336s(BaseAntenna):
         """
         phi_3 = self.params['beamwidth_az_deg']
         theta_3 = self.params['beamwidth_el_deg']
-        psi = self.__psi(phi, theta)
 
         if (0 <= psi) and (psi <= 90):
-            alpha = self.__alpha(phi, theta)
-            alpha_rad = math.radians(alpha)
+            alpha_rad = self.__alpha_rad(phi, theta)
             a = math.cos(alpha_rad) / phi_3
             b = math.sin(alpha_rad) / theta_3
-            return 1 / math.sqrt(a**2 + b**2)
+            return 1 / math.hypot(a, b)
         elif (90 < psi) and (psi <= 180):
-            phi_3m = self.__phi_3m(phi, theta)
+            phi_3m = self.__phi_3m(phi)
             theta_rad = math.radians(theta)
             a = math.cos(theta_rad) / phi_3m
             b = math.sin(theta_rad) / theta_3
-            return 1 / math.sqrt(a**2 + b**2)
+            return 1 / math.hypot(a, b)
 
 
-    def __phi_3m(self, phi, theta):
+    def __phi_3m(self, phi):
         """Compute equivalent 3 dB beamwidth phi_3m (degrees)
         in the azimuth plane
 
@@ -845,9 +1305,6 @@ class ITUF1336s(BaseAntenna):
         phi : int or float
             Azimuth angle relative to the angle of the maximum gain
             in the horizontal plane (degrees) (–180 <= phi <= 180)
-        theta : int or float
-            Elevation angle relative to the angle of the maximum gain
-            in the vertical plane (degrees)(–90 <= theta <= 90)
 
         Returns
         -------
@@ -874,12 +1331,12 @@ class ITUF1336s(BaseAntenna):
             x = math.radians((phi_abs - phi_th) / (180 - phi_th) * 90)
             a = math.cos(x) / phi_3
             b = math.sin(x) / theta_3
-            return 1 / math.sqrt(a**2 + b**2)
+            return 1 / math.hypot(a, b)
 
 
     @staticmethod
-    def __alpha(phi, theta):
-        """Compute alpha (degrees).
+    def __alpha_rad(phi, theta):
+        """Compute alpha (radians).
 
         Parameters
         ----------
@@ -893,7 +1350,7 @@ class ITUF1336s(BaseAntenna):
         Returns
         -------
         float
-            Alpha angle (degrees)
+            Alpha angle (radians)
 
         Notes
         -----
@@ -904,11 +1361,10 @@ class ITUF1336s(BaseAntenna):
 
         # Ref. to [1] Recommends 3.2.1, formula (2d2)
         # atan2() is used instead atan()
-        alpha_rad = math.atan2(
+        return math.atan2(
                 math.tan(theta_rad),
                 math.sin(phi_rad)
         )
-        return math.degrees(alpha_rad)
 
 
     def __gain_average_6_70ghz(self, phi, theta):
@@ -938,12 +1394,12 @@ class ITUF1336s(BaseAntenna):
         g_0 = self.params['max_gain_dbi']
 
         psi = self.__psi(phi, theta)  # Ref. to [1] Formula (2d4)
-        psi_a = self.__psi_a(phi, theta)  # Ref. to [1] Formula (2d3)
+        psi_a = self.__psi_a(phi, theta, psi)  # Formula (2d3)
 
         x = psi / psi_a  # Ref. to [1] Formula (2d5)
 
         # Final gain calculation Ref. to [1] Formula (2f)
         if (0 <= x) and (x < 1.152):
-            return g_0 - 12 * x**2
+            return g_0 - 12 * x * x
         elif 1.152 <= x:
             return g_0 - 15 - 15 * math.log10(x)
\ No newline at end of file
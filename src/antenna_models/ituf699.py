@@ -7,6 +7,7 @@ assessment in the frequency range from 100 MHz to 86 GHz"
 
 
 import math
+import numpy as np
 from base import BaseAntenna
 
 
@@ -85,55 +86,60 @@ class ITUF699(BaseAntenna):
         # 1         1           0       6       same as case 2
         # 1         1           1       7       same as case 3
 
-        # Input availability case 1
-        if (self.params.get('max_gain_dbi') is not None
-                and self.params.get('diameter_m') is None
-                and self.params.get('beamwidth_deg') is None):
-            self.params['d_to_l'] = self.__d_to_l_from_g_max(self.params['max_gain_dbi'])
-        # Input availability case 2
-        elif (self.params.get('max_gain_dbi') is None
-                and self.params.get('diameter_m') is not None
-                and self.params.get('beamwidth_deg') is None):
-            wavelength = self.__wavelength(self.params['oper_freq_mhz'])
-            d_to_l = self.params['diameter_m'] / wavelength
-            self.params['d_to_l'] = d_to_l
-            self.params['max_gain_dbi'] = self.__g_max_from_d_to_l(d_to_l)
-        # Input availability case 3
-        elif (self.params.get('max_gain_dbi') is not None
-              and self.params.get('diameter_m') is not None
-              and self.params.get('beamwidth_deg') is None):
+        max_gain = self.params.get('max_gain_dbi')
+        diameter = self.params.get('diameter_m')
+        beamwidth = self.params.get('beamwidth_deg')
+
+        # Input availability cases 2, 3, 6 and 7 (beamwidth not used)
+        if diameter is not None:
             wavelength = self.__wavelength(self.params['oper_freq_mhz'])
-            d_to_l = self.params['diameter_m'] / wavelength
+            d_to_l = diameter / wavelength
             self.params['d_to_l'] = d_to_l
+            # In cases 2 and 6 max. gain is calculated from D/l
+            if max_gain is None:
+                self.params['max_gain_dbi'] = self.__g_max_from_d_to_l(d_to_l)
+        # Input availability cases 1 and 5 (beamwidth not used)
+        elif max_gain is not None:
+            self.params['d_to_l'] = self.__d_to_l_from_g_max(max_gain)
         # Input availability case 4
-        elif (self.params.get('max_gain_dbi') is None
-              and self.params.get('diameter_m') is None
-              and self.params.get('beamwidth_deg') is not None):
-            self.params['d_to_l'] = self.__d_to_l_from_beamwidth(self.params['beamwidth_deg'])
-            self.params['max_gain_dbi'] = self.__g_max_from_beamwidht(self.params['beamwidth_deg'])
-        # Input availability case 5
-        elif (self.params.get('max_gain_dbi') is not None
-              and self.params.get('diameter_m') is None
-              and self.params.get('beamwidth_deg') is not None):
-            # This case is same as case 1 above
-            self.params['d_to_l'] = self.__d_to_l_from_g_max(self.params['max_gain_dbi'])
-        # Input availability case 6
-        elif (self.params.get('max_gain_dbi') is None
-              and self.params.get('diameter_m') is not None
-              and self.params.get('beamwidth_deg') is not None):
-            # It is the same as the case 2 above
-            wavelength = self.__wavelength(self.params['oper_freq_mhz'])
-            d_to_l = self.params['diameter_m'] / wavelength
-            self.params['d_to_l'] = d_to_l
-            self.params['max_gain_dbi'] = self.__g_max_from_d_to_l(d_to_l)
-        # Input availability case 7
-        elif (self.params.get('max_gain_dbi') is not None
-              and self.params.get('diameter_m') is not None
-              and self.params.get('beamwidth_deg') is not None):
-            # It is the same as the case 3 above
-            wavelength = self.__wavelength(self.params['oper_freq_mhz'])
-            d_to_l = self.params['diameter_m'] / wavelength
-            self.params['d_to_l'] = d_to_l
+        else:
+            self.params['d_to_l'] = self.__d_to_l_from_beamwidth(beamwidth)
+            self.params['max_gain_dbi'] = self.__g_max_from_beamwidht(beamwidth)
+
+        # ~ Calculate constants of the gain formulas ~
+
+        d_to_l = self.params['d_to_l']
+        g_max = self.params['max_gain_dbi']
+        self._log10_d_to_l = math.log10(d_to_l)
+        self._g_1 = 2 + 15 * self._log10_d_to_l
+        # It is complex if g_max < g_1, which fails computing gains
+        self._phi_m = 20 * 1 / d_to_l * (g_max - self._g_1) ** 0.5
+        self._phi_r = 15.85 * d_to_l ** (-0.6)  # Ref. [1] Rec. 2.1
+        self._phi_s = 144.5 * d_to_l**(-0.2)  # Ref. [1] Rec. 2.3
+        self._phi_g1 = 100 / d_to_l  # where G1 ends in Rec. 2.2 and 2.3
+        self._g_far_23 = -2 - 5 * self._log10_d_to_l
+
+        # Set band dependent constants of Recommends 2.1 and 2.2
+        if self.params['freq_band'] == '70-86 GHz':
+            self._phi_far = 120  # where far side-lobe region starts
+            self._g_far_21 = -20  # far side-lobe gain as per Rec. 2.1
+            self._g_far_22 = -10 * self._log10_d_to_l
+        else:  # follow '1-70 GHz' root, unused in '0.1-1 GHz'
+            self._phi_far = 48
+            self._g_far_21 = -10
+            self._g_far_22 = 10 - 10 * self._log10_d_to_l
+
+        # Select the gain formulas depending on the antenna
+        # Diameter / wavelength ratio
+        if self.params['freq_band'] == '0.1-1 GHz':
+            self._gain_func = self.__gain_23
+            self._gain_array_funcs = self.__gain_23_funcs
+        elif d_to_l > 100:
+            self._gain_func = self.__gain_21
+            self._gain_array_funcs = self.__gain_21_funcs
+        else:
+            self._gain_func = self.__gain_22
+            self._gain_array_funcs = self.__gain_22_funcs
 
 
     def _update_specs(self):
@@ -157,17 +163,15 @@ class ITUF699(BaseAntenna):
         self.specs['comment'] = comment_str
 
         # Generate angles from 0 to 360 (inclusive)
-        angles = [i for i in range(0, 361)]
-
-        # Create empty lists for h_loss
-        h_loss = []
+        angles = list(range(361))
 
         g_max = self.params['max_gain_dbi']  # for attenuation calc.
 
-        # Calculate h_loss array's values
-        for angle in angles:
-            # calc. gain, then attenuation, then append
-            h_loss.append(round(g_max - self.gain(off_axis_angle=angle), 2))
+        # The pattern is symmetric, so calculate gains for 0..180 deg.
+        # at once, then attenuation, and mirror it to 181..360 deg.
+        h_loss = self._gain_array(np.arange(181))
+        h_loss = self._round_losses(g_max - h_loss)
+        h_loss = np.concatenate([h_loss, h_loss[-2::-1]])
 
         # Make v_loss the same as h_loss
         v_loss = h_loss
@@ -185,13 +189,14 @@ class ITUF699(BaseAntenna):
 
         Keyword Args
         ------------
-        off_axis_angle (int or float) :
+        off_axis_angle (int, float or array_like) :
             Off-axis angle (degrees) (0 <= off_axis_angle <= 180)
 
         Returns
         -------
-        int or float
-            Antenna gain (dBi) at given off-axis angle
+        int, float or numpy.ndarray
+            Antenna gain (dBi) at given off-axis angle; for an array of
+            off-axis angles, the same as gain_batch()
 
         Notes
         -----
@@ -200,7 +205,7 @@ class ITUF699(BaseAntenna):
 
         # Define expected keys and their types
         required_keys = {
-            "off_axis_angle": (int, float),  # Accept int or float for azimuth
+            "off_axis_angle": (int, float, list, tuple, np.ndarray),  # Accept int or float, or their array for azimuth
         }
 
         # Check if all required keys are present
@@ -214,25 +219,85 @@ class ITUF699(BaseAntenna):
             if not isinstance(value, expected_types):
                 raise TypeError(f"Key '{key}' must be of type {expected_types}, got {type(value).__name__}")
 
-        # If validation passes, assign values to variables
-        phi = kwargs['off_axis_angle']
+        # If validation passes, compute the gain; an array of angles is
+        # handed over to gain_batch()
+        if isinstance(kwargs['off_axis_angle'], (list, tuple, np.ndarray)):
+            return self.gain_batch(kwargs['off_axis_angle'])
+        return self._gain(kwargs['off_axis_angle'])
+
+
+    def _gain(self, phi):
+        """Compute antenna gain (dBi) without validating the input.
+
+        Parameters
+        ----------
+        phi : int or float
+            Off-axis angle (degrees)
 
+        Returns
+        -------
+        int or float
+            Antenna gain (dBi) at the off-axis angle
+        """
         # Bring the angle to expected ranges
         phi = self.__normalize_off_axis_angle(phi)
 
-        # route to appropriate private method for final calc
-        # depending on the antenna Diameter / wavelength ratio
-        if self.params['freq_band'] == '0.1-1 GHz':
-            if self.params['d_to_l'] < 0.63:
-                raise ValueError(f"ITU-R F.699-8 applies only D/l>0.63!")
-            else:
-                return self.__gain_23(phi)
+        # Compute the gain by the formulas selected in _post_set_params()
+        return self._gain_func(phi)
 
-        elif self.params['d_to_l'] > 100:
-            return self.__gain_21(phi)
 
-        elif self.params['d_to_l'] <= 100:
-            return self.__gain_22(phi)
+    def _gain_array(self, phi):
+        """Compute antenna gains (dBi) at given off-axis angles.
+
+        Parameters
+        ----------
+        phi : array_like
+            Off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) at the off-axis angles
+        """
+        # Bring the angles to expected ranges
+        phi = self.__normalize_off_axis_angles(phi)
+
+        # Take the formulas selected in _post_set_params()
+        breakpoints, funcs = self._gain_array_funcs()
+
+        # Find the region of each off-axis angle; a region is empty if
+        # its upper bound is below the preceding one
+        regions = np.searchsorted(
+            np.maximum.accumulate(breakpoints), phi, side='right'
+        )
+
+        # Compute the gains by the formula of each region
+        gains = np.piecewise(
+            phi,
+            [regions == i for i in range(len(funcs))],
+            funcs,
+        )
+        gains[phi == 0] = self.params['max_gain_dbi']  # Boresight
+
+        return gains
+
+
+    @staticmethod
+    def __normalize_off_axis_angles(angles):
+        """Normalize angles to be between 0 and +180 degrees.
+
+        Parameters
+        ----------
+        angles : array_like
+            off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Off-axis angles (degrees) between 0 and +180
+        """
+        angles = np.mod(np.asarray(angles, dtype=np.float64), 360)  # Wrap angles to [0, 360)
+        return np.where(angles > 180, 360 - angles, angles)  # Mirror to [0, 180]
 
 
     @staticmethod
@@ -249,7 +314,7 @@ class ITUF699(BaseAntenna):
         int or float
             Azimuth angle (degrees) between 0 and +180
         """
-        angle = (angle % 360 + 360) % 360  # Wrap angle to [0, 360]
+        angle = angle % 360  # Wrap angle to [0, 360)
         if angle > 180:
             angle = 360 - angle  # Mirror to [0, 180]
         return angle
@@ -309,7 +374,7 @@ class ITUF699(BaseAntenna):
         ----------
         Ref. to [1] Recommends 3
         """
-        return math.pow(10, (g_max - 7.7) / 20)
+        return 10 ** ((g_max - 7.7) / 20)
 
 
     @staticmethod
@@ -371,7 +436,7 @@ class ITUF699(BaseAntenna):
         ----------
         Ref. to [1] Recommends 4.2
         """
-        return math.pow(10, (44.5 - g_max) / 20)
+        return 10 ** ((44.5 - g_max) / 20)
 
 
     def __gain_21(self, phi):
@@ -396,37 +461,25 @@ class ITUF699(BaseAntenna):
             return g_max  # no more calculations
 
         d_to_l = self.params['d_to_l']
-        g_1 = 2 + 15 * math.log10(d_to_l)
-        phi_m = 20 * 1 / d_to_l * (g_max - g_1) ** 0.5
+        g_1 = self._g_1
+        phi_m = self._phi_m
         if isinstance(phi_m, complex):
             raise ValueError(f"Error! phi_m in Rec. 2.1.2 became complex number!")
-        phi_r = 15.85 * d_to_l ** (-0.6)
-
-        if self.params['freq_band'] == '1-70 GHz':
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10 ** (-3) * (d_to_l * phi) ** 2
-
-            elif phi_m <= phi < phi_r:
-                return g_1
+        phi_r = self._phi_r
 
-            elif phi_r <= phi < 48:
-                return 32 - 25 * math.log10(phi)
+        phi_far = self._phi_far  # depends on the frequency band
 
-            elif 48 <= phi <= 180:
-                return -10
-
-        elif self.params['freq_band'] == '70-86 GHz':
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2
+        if 0 < phi < phi_m:
+            return g_max - 2.5 * 10 ** (-3) * (d_to_l * phi) ** 2
 
-            elif phi_m <= phi < phi_r:
-                return g_1
+        elif phi_m <= phi < phi_r:
+            return g_1
 
-            elif phi_r <= phi < 120:
-                return 32 - 25 * math.log10(phi)
+        elif phi_r <= phi < phi_far:
+            return 32 - 25 * math.log10(phi)
 
-            elif 120 <= phi <= 180:
-                return -20
+        elif phi_far <= phi <= 180:
+            return self._g_far_21
 
     def __gain_22(self, phi):
         """Compute antenna gain as per [1] Recommends 2.2.
@@ -449,34 +502,23 @@ class ITUF699(BaseAntenna):
             return g_max  # no more calculations
 
         d_to_l = self.params['d_to_l']
-        g_1 = 2 + 15 * math.log10(d_to_l)
-        phi_m = 20 * 1 / d_to_l * (g_max - g_1)**0.5
-
-        if self.params['freq_band'] == '1-70 GHz':
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2
+        g_1 = self._g_1
+        phi_m = self._phi_m
+        phi_g1 = self._phi_g1
 
-            elif phi_m <= phi < (100 / d_to_l):
-                return g_1
+        phi_far = self._phi_far  # depends on the frequency band
 
-            elif (100 / d_to_l) <= phi < 48:
-                return 52 - 10 * math.log10(d_to_l) - 25 * math.log10(phi)
-
-            elif 48 <= phi <= 180:
-                return 10 - 10 * math.log10(d_to_l)
-
-        elif self.params['freq_band'] == '70-86 GHz':
-            if 0 < phi < phi_m:
-                return g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2
+        if 0 < phi < phi_m:
+            return g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2
 
-            elif phi_m <= phi < (100 / d_to_l):
-                return g_1
+        elif phi_m <= phi < phi_g1:
+            return g_1
 
-            elif (100 / d_to_l) <= phi < 120:
-                return 52 - 10 * math.log10(d_to_l) - 25 * math.log10(phi)
+        elif phi_g1 <= phi < phi_far:
+            return 52 - 10 * self._log10_d_to_l - 25 * math.log10(phi)
 
-            elif 120 <= phi <= 180:
-                return -10 * math.log10(d_to_l)
+        elif phi_far <= phi <= 180:
+            return self._g_far_22
 
     def __gain_23(self, phi):
         """Compute antenna gain as per [1] Recommends 2.3.
@@ -493,24 +535,116 @@ class ITUF699(BaseAntenna):
         int or float
             Antenna gain (dBi) for given off-axis angle
         """
+        d_to_l = self.params['d_to_l']
+        if d_to_l < 0.63:
+            raise ValueError(f"ITU-R F.699-8 applies only D/l>0.63!")
+
         g_max = self.params['max_gain_dbi']
 
         if phi == 0:
             return g_max  # no more calculations
 
-        d_to_l = self.params['d_to_l']
-        g_1 = 2 + 15 * math.log10(d_to_l)
-        phi_m = 20 * 1 / d_to_l * (g_max - g_1)**0.5
-        phi_s = 144.5 * d_to_l**(-0.2)
+        g_1 = self._g_1
+        phi_m = self._phi_m
+        phi_g1 = self._phi_g1
+        phi_s = self._phi_s
 
         if 0 < phi < phi_m:
             return g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2
 
-        elif phi_m <= phi < (100 / d_to_l):
+        elif phi_m <= phi < phi_g1:
             return g_1
 
-        elif (100 / d_to_l) <= phi < phi_s:
-            return 52 - 10 * math.log10(d_to_l) - 25 * math.log10(phi)
+        elif phi_g1 <= phi < phi_s:
+            return 52 - 10 * self._log10_d_to_l - 25 * math.log10(phi)
 
         elif phi_s <= phi <= 180:
-            return -2 - 5 * math.log10(d_to_l)
+            return self._g_far_23
+
+
+    def __gain_21_funcs(self):
+        """Select gain formulas as per [1] Recommends 2.1.
+
+        This is the case when Antenna Diameter / wavelength > 100
+
+        Returns
+        -------
+        tuple
+            Upper bounds (degrees) of the off-axis angle regions, and
+            functions computing antenna gains (dBi) at arrays of
+            off-axis angles (degrees) for each region
+        """
+        g_max = self.params['max_gain_dbi']
+        d_to_l = self.params['d_to_l']
+        g_1 = self._g_1
+        phi_m = self._phi_m
+        if isinstance(phi_m, complex):
+            raise ValueError(f"Error! phi_m in Rec. 2.1.2 became complex number!")
+        phi_r = self._phi_r
+
+        return [phi_m, phi_r, self._phi_far], [
+            lambda phi: g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2,
+            g_1,
+            lambda phi: 32 - 25 * np.log10(phi),
+            self._g_far_21,
+        ]
+
+
+    def __gain_22_funcs(self):
+        """Select gain formulas as per [1] Recommends 2.2.
+
+        This is the case Antenna Diameter / wavelength <= 100
+
+        Returns
+        -------
+        tuple
+            Upper bounds (degrees) of the off-axis angle regions, and
+            functions computing antenna gains (dBi) at arrays of
+            off-axis angles (degrees) for each region
+        """
+        g_max = self.params['max_gain_dbi']
+        d_to_l = self.params['d_to_l']
+        g_1 = self._g_1
+        phi_m = self._phi_m
+        if isinstance(phi_m, complex):
+            raise TypeError(f"Error! phi_m in Rec. 2.2 became complex number!")
+
+        return [phi_m, self._phi_g1, self._phi_far], [
+            lambda phi: g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2,
+            g_1,
+            lambda phi: (52 - 10 * self._log10_d_to_l
+                         - 25 * np.log10(phi)),
+            self._g_far_22,
+        ]
+
+
+    def __gain_23_funcs(self):
+        """Select gain formulas as per [1] Recommends 2.3.
+
+        This is the case Antenna Diameter / wavelength > 0.63
+
+        Returns
+        -------
+        tuple
+            Upper bounds (degrees) of the off-axis angle regions, and
+            functions computing antenna gains (dBi) at arrays of
+            off-axis angles (degrees) for each region
+        """
+        d_to_l = self.params['d_to_l']
+        if d_to_l < 0.63:
+            raise ValueError(f"ITU-R F.699-8 applies only D/l>0.63!")
+
+        g_max = self.params['max_gain_dbi']
+        g_1 = self._g_1
+        phi_m = self._phi_m
+        if isinstance(phi_m, complex):
+            raise TypeError(f"Error! phi_m in Rec. 2.3 became complex number!")
+        phi_s = self._phi_s
+
+        return [phi_m, self._phi_g1, phi_s], [
+            lambda phi: g_max - 2.5 * 10**(-3) * (d_to_l * phi)**2,
+            g_1,
+            lambda phi: (52 - 10 * self._log10_d_to_l
+                         - 25 * np.log10(phi)),
+            self._g_far_23,
+        ]
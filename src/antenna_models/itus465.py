@@ -6,6 +6,7 @@ assessment in the frequency range from 2 to 31 GHz"
 """
 
 import math
+import numpy as np
 from base import BaseAntenna
 
 
@@ -95,13 +96,17 @@ class ITUS465(BaseAntenna):
         # in all other Cases
         # d_to_l is provided
 
+        # ~ Calculate constants of the gain formulas ~
+
+        self._phi_min = self.__phi_min()
+
     def _update_specs(self):
         """Update specs data."""
         # Indicate all parameters used in the modeling in comment
 
         # For attenuation calculation only
-        phi_min = self.__phi_min()
-        g_max = round(self.gain(off_axis_angle=phi_min), 2)
+        phi_min = self._phi_min
+        g_max = round(self._gain(phi_min), 2)
 
         comment_str = (
             f"D/lambda: {self.params['d_to_l']:,.2f}. "
@@ -126,21 +131,17 @@ class ITUS465(BaseAntenna):
         self.specs['comment'] = comment_str
 
         # Generate angles from 0 to 360 (inclusive)
-        angles = [i for i in range(0, 361)]
+        angles = list(range(361))
 
-        # Create empty lists for h_loss
-        h_loss = []
+        # The pattern is symmetric, so calculate gains for 0..180 deg.
+        # at once, then attenuation, and mirror it to 181..360 deg.
+        h_loss = self._gain_array(np.arange(181))
+        h_loss = self._round_losses(g_max - h_loss)
+        # Angles below phi_min have no gain defined and stay NaN
+        h_loss = np.concatenate([h_loss, h_loss[-2::-1]])
 
-        # Calculate h_loss array's values
-        for angle in angles:
-            gain = self.gain(off_axis_angle=angle)
-            if gain is not None:
-                h_loss.append(round(g_max - gain, 2))
-            else:
-                h_loss.append('n/a')
-
-        # Make v_loss the same as h_loss
-        v_loss = h_loss
+        # Make v_loss the same as h_loss, but a separate array
+        v_loss = h_loss.copy()
 
         # Complete specs dict. with angle/loss data
         self.specs['h_pattern_datapoint']['phi'] = angles
@@ -154,20 +155,21 @@ class ITUS465(BaseAntenna):
 
         Keyword Args
         ------------
-        off_axis_angle (int or float) :
+        off_axis_angle (int, float or array_like) :
             the off-axis angle between the direction of interest and the
             boresight axis (degrees) (0 <= off_axis_angle <= 180)
 
         Returns
         -------
-        None, int or float
+        int, float or numpy.ndarray
             Antenna gain (dBi) at given off-axis angle. If off_axis_angle is
-            less than phi_min, None is returned.
+            less than phi_min, NaN is returned. For an array of off-axis
+            angles, the same as gain_batch().
         """
 
         # Define expected keys and their types
         required_keys = {
-            "off_axis_angle": (int, float),  # Accept int or float for azimuth
+            "off_axis_angle": (int, float, list, tuple, np.ndarray),  # Accept int or float, or their array for azimuth
         }
 
         # Check if all required keys are present
@@ -181,23 +183,69 @@ class ITUS465(BaseAntenna):
             if not isinstance(value, expected_types):
                 raise TypeError(f"Key '{key}' must be of type {expected_types}, got {type(value).__name__}")
 
-        # If validation passes, assign values to variables
-        phi = kwargs['off_axis_angle']
+        # If validation passes, compute the gain; an array of angles is
+        # handed over to gain_batch()
+        if isinstance(kwargs['off_axis_angle'], (list, tuple, np.ndarray)):
+            return self.gain_batch(kwargs['off_axis_angle'])
+        return self._gain(kwargs['off_axis_angle'])
+
+    def _gain(self, phi):
+        """Compute antenna gain (dBi) without validating the input.
 
+        Parameters
+        ----------
+        phi : int or float
+            Off-axis angle (degrees)
+
+        Returns
+        -------
+        int or float
+            Antenna gain (dBi) at the off-axis angle; NaN if the
+            off-axis angle is less than phi_min
+        """
         # Bring the angle to expected ranges
         phi = self.__normalize_off_axis_angle(phi)
 
-        phi_min = self.__phi_min()
+        phi_min = self._phi_min
 
         # Calculate the gain
         if phi < phi_min:
-            d_to_l = self.params['d_to_l']
-            return None
+            return math.nan
         elif phi_min <= phi < 48:
             return 32 - 25 * math.log10(phi)
         else:
             return -10
 
+    def _gain_array(self, phi):
+        """Compute antenna gains (dBi) at given off-axis angles.
+
+        Parameters
+        ----------
+        phi : array_like
+            Off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) at the off-axis angles; NaN where the
+            off-axis angle is less than phi_min
+        """
+        # Bring the angles to expected ranges
+        phi = self.__normalize_off_axis_angles(phi)
+
+        phi_min = self._phi_min
+
+        # Find the region of each off-axis angle
+        regions = np.searchsorted([phi_min, max(phi_min, 48)], phi,
+                                  side='right')
+
+        # Calculate the gains
+        return np.piecewise(
+            phi,
+            [regions == 0, regions == 1, regions == 2],
+            [np.nan, lambda phi: 32 - 25 * np.log10(phi), -10],
+        )
+
     def __phi_min(self):
         """Calculate phi_min.
 
@@ -215,6 +263,23 @@ class ITUS465(BaseAntenna):
             phi_min = 2.5  # Ref. [1] NOTE 5
         return phi_min
 
+    @staticmethod
+    def __normalize_off_axis_angles(angles):
+        """Normalize angles to be between 0 and +180 degrees.
+
+        Parameters
+        ----------
+        angles : array_like
+            off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Off-axis angles (degrees) between 0 and +180
+        """
+        angles = np.mod(np.asarray(angles, dtype=np.float64), 360)  # Wrap angles to [0, 360)
+        return np.where(angles > 180, 360 - angles, angles)  # Mirror to [0, 180]
+
     @staticmethod
     def __normalize_off_axis_angle(angle):
         """Normalize angle to be between 0 and +180 degrees.
@@ -229,7 +294,7 @@ class ITUS465(BaseAntenna):
         int or float
             Azimuth angle (degrees) between 0 and +180
         """
-        angle = (angle % 360 + 360) % 360  # Wrap angle to [0, 360]
+        angle = angle % 360  # Wrap angle to [0, 360)
         if angle > 180:
             angle = 360 - angle  # Mirror to [0, 180]
         return angle
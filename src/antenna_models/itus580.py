@@ -5,6 +5,7 @@ for antennas of earth stations operating with geostationary satellites"
 """
 
 import math
+import numpy as np
 
 from antenna_models import ITUS465
 from base import BaseAntenna
@@ -43,10 +44,6 @@ class ITUS580(BaseAntenna):
     }
 
 
-    def __del__(self):
-        del self.s465_antenna
-
-
     def _post_set_params(self):
         """Set dependent and not-set optional parameters.
 
@@ -110,14 +107,19 @@ class ITUS580(BaseAntenna):
                 f"Resulting value: {self.params['d_to_l']:,.2f}"
             )
 
+        # ~ Calculate constants of the gain formulas ~
+
+        self._phi_min = self.__phi_min()
+        self.s465_antenna.set_params(d_to_l=self.params['d_to_l'])
+
 
     def _update_specs(self):
         """Update specs data."""
         # Indicate all parameters used in the modeling in comment
 
         # For attenuation calculation only
-        phi_min = self.__phi_min()
-        g_max = round(self.gain(off_axis_angle=phi_min), 2)
+        phi_min = self._phi_min
+        g_max = round(self._gain(phi_min), 2)
 
         comment_str = (
             f"D/lambda: {self.params['d_to_l']:,.2f}. "
@@ -142,18 +144,14 @@ class ITUS580(BaseAntenna):
         self.specs['comment'] = comment_str
 
         # Generate angles from 0 to 360 (inclusive)
-        angles = [i for i in range(0, 361)]
+        angles = list(range(361))
 
-        # Create empty lists for h_loss
-        h_loss = []
-
-        # Calculate h_loss array's values
-        for angle in angles:
-            gain = self.gain(off_axis_angle=angle)
-            if gain is not None:
-                h_loss.append(round(g_max - gain, 2))
-            else:
-                h_loss.append('n/a')
+        # The pattern is symmetric, so calculate gains for 0..180 deg.
+        # at once, then attenuation, and mirror it to 181..360 deg.
+        h_loss = self._gain_array(np.arange(181))
+        h_loss = self._round_losses(g_max - h_loss)
+        # Angles below phi_min have no gain defined and stay NaN
+        h_loss = np.concatenate([h_loss, h_loss[-2::-1]])
 
         # Make v_loss the same as h_loss
         v_loss = h_loss
@@ -170,20 +168,21 @@ class ITUS580(BaseAntenna):
 
         Keyword Args
         ------------
-        off_axis_angle (int or float) :
+        off_axis_angle (int, float or array_like) :
             the off-axis angle between the direction of interest and the
             boresight axis (degrees) (0 <= off_axis_angle <= 180)
 
         Returns
         -------
-        None, int or float
+        int, float or numpy.ndarray
             Antenna gain (dBi) at given off-axis angle. If off_axis_angle is
-            less than phi_min, None is returned.
+            less than phi_min, NaN is returned. For an array of off-axis
+            angles, the same as gain_batch().
         """
 
         # Define expected keys and their types
         required_keys = {
-            "off_axis_angle": (int, float),  # Accept int or float for azimuth
+            "off_axis_angle": (int, float, list, tuple, np.ndarray),  # Accept int or float, or their array for azimuth
         }
 
         # Check if all required keys are present
@@ -197,23 +196,91 @@ class ITUS580(BaseAntenna):
             if not isinstance(value, expected_types):
                 raise TypeError(f"Key '{key}' must be of type {expected_types}, got {type(value).__name__}")
 
-        # If validation passes, assign values to variables
-        phi = kwargs['off_axis_angle']
+        # If validation passes, compute the gain; an array of angles is
+        # handed over to gain_batch()
+        if isinstance(kwargs['off_axis_angle'], (list, tuple, np.ndarray)):
+            return self.gain_batch(kwargs['off_axis_angle'])
+        return self._gain(kwargs['off_axis_angle'])
+
+
+    def _gain(self, phi):
+        """Compute antenna gain (dBi) without validating the input.
+
+        Parameters
+        ----------
+        phi : int or float
+            Off-axis angle (degrees)
 
+        Returns
+        -------
+        int or float
+            Antenna gain (dBi) at the off-axis angle; NaN if the
+            off-axis angle is less than phi_min
+        """
         # Bring the angle to expected ranges
         phi = self.__normalize_off_axis_angle(phi)
-        phi_min = self.__phi_min()
-        self.s465_antenna.set_params(d_to_l=self.params['d_to_l'])
+        phi_min = self._phi_min
 
         if phi < phi_min:
-            return None
+            return math.nan
         elif phi <= 20:
             return 29 - 25 * math.log10(phi)
         elif phi <= 26.3:
-            s465_gain = self.s465_antenna.gain(off_axis_angle=phi)
+            s465_gain = self.s465_antenna._gain(phi)
             return min(-3.5, s465_gain)  # see [1] Note 5
         else:
-            return self.s465_antenna.gain(off_axis_angle=phi)
+            return self.s465_antenna._gain(phi)
+
+
+    def _gain_array(self, phi):
+        """Compute antenna gains (dBi) at given off-axis angles.
+
+        Parameters
+        ----------
+        phi : array_like
+            Off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) at the off-axis angles; NaN where the
+            off-axis angle is less than phi_min
+        """
+        # Bring the angles to expected ranges
+        phi = self.__normalize_off_axis_angles(phi)
+        phi_min = self._phi_min
+        s465_gains = self.s465_antenna.gain_batch
+
+        # Calculate the gains
+        return np.piecewise(
+            phi,
+            [phi < phi_min,
+             (phi_min <= phi) & (phi <= 20),
+             (20 < phi) & (phi <= 26.3),
+             26.3 < phi],
+            [np.nan,
+             lambda phi: 29 - 25 * np.log10(phi),
+             lambda phi: np.minimum(-3.5, s465_gains(phi)),  # [1] Note 5
+             s465_gains],
+        )
+
+
+    @staticmethod
+    def __normalize_off_axis_angles(angles):
+        """Normalize angles to be between 0 and +180 degrees.
+
+        Parameters
+        ----------
+        angles : array_like
+            off-axis angles (degrees)
+
+        Returns
+        -------
+        numpy.ndarray
+            Off-axis angles (degrees) between 0 and +180
+        """
+        angles = np.mod(np.asarray(angles, dtype=np.float64), 360)  # Wrap angles to [0, 360)
+        return np.where(angles > 180, 360 - angles, angles)  # Mirror to [0, 180]
 
 
     @staticmethod
@@ -230,7 +297,7 @@ class ITUS580(BaseAntenna):
         int or float
             Azimuth angle (degrees) between 0 and +180
         """
-        angle = (angle % 360 + 360) % 360  # Wrap angle to [0, 360]
+        angle = angle % 360  # Wrap angle to [0, 360)
         if angle > 180:
             angle = 360 - angle  # Mirror to [0, 180]
         return angle
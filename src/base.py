@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-import textwrap
-import matplotlib.pyplot as plt
+import os
 import numpy as np
 
+# Angle ticks (0, 45, 90, ..., 360 deg.) of polar plots and their labels
+# varying between -180, 0, 180 deg.
+_THETA_TICKS = np.linspace(0, 2 * np.pi, 9)
+_THETA_TICK_LABELS = ['0°', '45°', '90°', '135°', '180°', '-135°', '-90°',
+                      '-45°', '']
+
 
 class BaseAntenna(ABC):
     """Base class for all antenna models."""
@@ -11,6 +16,8 @@ class BaseAntenna(ABC):
 
     def __init__(self):
         self.params = {}
+        # Parameters for which specs property was last updated
+        self._specs_cache_key = None
         # Refer to MSI Planet file format description
         self.specs = {
             'name': None,  # Name of the antenna
@@ -85,6 +92,9 @@ class BaseAntenna(ABC):
         # Set validated parameters
         self.params = validated_params
 
+        # Invalidate specs property computed for previous parameters
+        self._specs_cache_key = None
+
         # Call the post-process hook
         self._post_set_params()
 
@@ -98,14 +108,92 @@ class BaseAntenna(ABC):
         pass
 
 
+    def gain_batch(self, *angles):
+        """Compute antenna gains (dBi) at many directions at once.
+
+        Parameters
+        ----------
+        *angles : array_like
+            Angles (degrees) of the directions, in the order of the
+            keyword arguments of gain(); arrays are broadcast together
+
+        Returns
+        -------
+        numpy.ndarray
+            Antenna gains (dBi) in the directions; NaN where the model
+            defines no gain (e.g. below phi_min of ITU-R S.465/S.580)
+        """
+        return self._gain_array(*angles)
+
+
+    @abstractmethod
+    def _gain_array(self, *angles):
+        pass
+
+
     @abstractmethod
     def _update_specs(self):
         pass
 
 
-    def show_patterns(self):
+    @staticmethod
+    def _round_losses(losses):
+        """Round attenuation values (dB) to 2 decimals.
+
+        np.round() scales the values by 100 before rounding, which gets
+        exact decimal ties (e.g. 57.325) wrong, so every value is rounded
+        by round() instead, as for a single gain.
+
+        Parameters
+        ----------
+        losses : numpy.ndarray
+            Attenuation values (dB)
+
+        Returns
+        -------
+        numpy.ndarray
+            Attenuation values (dB) rounded to 2 decimals
+        """
+        return np.array([round(loss, 2) for loss in losses.tolist()])
+
+
+    def _refresh_specs(self):
+        """Update specs property if parameters changed since last update."""
+        key = tuple(sorted(
+            (param, type(value), value)
+            for param, value in self.params.items()
+            if not isinstance(value, (list, dict))
+        ))
+
+        if key != self._specs_cache_key:
+            self._update_specs()
+            self._specs_cache_key = key
+
+
+    def show_patterns(self, show=True):
+        """Plot the H- and V-patterns of the antenna.
+
+        Parameters
+        ----------
+        show : bool, optional
+            Display the figure in a window (default). If False, or if the
+            ANTENNAS_HEADLESS environment variable is set, the figure is
+            only created, e.g. to be saved with its savefig() method.
+
+        Returns
+        -------
+        matplotlib.figure.Figure or None
+            The figure with the patterns if it is not displayed, otherwise
+            None (so that it is not drawn twice, e.g. in Jupyter)
+        """
+        # Import plotting modules only when plotting is needed
+        import textwrap
+
+        # No window is opened in headless mode (e.g. batch or CI runs)
+        show = show and not os.environ.get('ANTENNAS_HEADLESS')
+
         # Update specs property
-        self._update_specs()
+        self._refresh_specs()
 
         # ~ Extract horizontal pattern data from specs property ~
 
@@ -114,13 +202,8 @@ class BaseAntenna(ABC):
         # Get attenuation/loss data
         h_loss = self.specs['h_pattern_datapoint']['loss']
 
-        # Convert non-numeric values to NaN
-        h_loss_cleaned = []
-        for loss in h_loss:
-            try:
-                h_loss_cleaned.append(float(loss))
-            except (ValueError, TypeError):
-                h_loss_cleaned.append(np.nan)
+        # Undefined attenuation is NaN, which the plot skips
+        h_loss_cleaned = np.asarray(h_loss, dtype=np.float64)
 
         # Find the maximum and minimum values, ignoring NaN
         max_h_loss = np.nanmax(h_loss_cleaned)
@@ -131,22 +214,25 @@ class BaseAntenna(ABC):
 
         # ~ Extract vertical pattern data from specs property ~
 
-        # Get angles data along converting them to radians
-        v_theta = np.radians(self.specs['v_pattern_datapoint']['theta'])
-        # Get attenuation/loss data
+        v_theta = self.specs['v_pattern_datapoint']['theta']
         v_loss = self.specs['v_pattern_datapoint']['loss']
 
-        # Convert non-numeric values to NaN
-        v_loss_cleaned = []
-        for loss in v_loss:
-            try:
-                v_loss_cleaned.append(float(loss))
-            except (ValueError, TypeError):
-                v_loss_cleaned.append(np.nan)
+        # Reuse horizontal pattern data if the model shares it
+        if (v_theta is self.specs['h_pattern_datapoint']['phi']
+                and v_loss is h_loss):
+            v_theta = h_phi
+            v_loss_cleaned = h_loss_cleaned
+            max_v_loss, min_v_loss = max_h_loss, min_h_loss
+        else:
+            # Get angles data along converting them to radians
+            v_theta = np.radians(v_theta)
 
-        # Find the maximum and minimum values, ignoring NaN
-        max_v_loss = np.nanmax(v_loss_cleaned)
-        min_v_loss = np.nanmin(v_loss_cleaned)
+            # Undefined attenuation is NaN, which the plot skips
+            v_loss_cleaned = np.asarray(v_loss, dtype=np.float64)
+
+            # Find the maximum and minimum values, ignoring NaN
+            max_v_loss = np.nanmax(v_loss_cleaned)
+            min_v_loss = np.nanmin(v_loss_cleaned)
 
         # Find the max loss value for scaling the radial axis
         v_scale = max_v_loss - min_v_loss
@@ -159,11 +245,24 @@ class BaseAntenna(ABC):
         if v_scale < 3:
             v_scale = 4
 
-        # Create a figure with two polar subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2,
-                   subplot_kw={'projection': 'polar'},
-                   figsize=(12, 6)
-        )
+        # Radial ticks and their labels, the same for equal scales
+        h_ticks = np.linspace(min_h_loss, h_scale, 5)
+        h_tick_labels = [f'{int(val)} dB' for val in h_ticks]
+        if (min_v_loss, v_scale) == (min_h_loss, h_scale):
+            v_ticks, v_tick_labels = h_ticks, h_tick_labels
+        else:
+            v_ticks = np.linspace(min_v_loss, v_scale, 5)
+            v_tick_labels = [f'{int(val)} dB' for val in v_ticks]
+
+        # Create a figure with two polar subplots; a figure not to be
+        # displayed is not handed to pyplot, so no GUI backend is needed
+        if show:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(12, 6))
+        else:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(12, 6))
+        ax1, ax2 = fig.subplots(1, 2, subplot_kw={'projection': 'polar'})
 
         # First polar plot (H-pattern):
 
@@ -177,11 +276,9 @@ class BaseAntenna(ABC):
         # ax1.set_ylim(bottom=max_h_loss, top=min_h_loss)
         ax1.set_ylim(bottom=h_scale, top=min_h_loss)
         # Custom ticks for the radial axis
-        ax1.set_yticks(np.linspace(min_h_loss, h_scale, 5))
+        ax1.set_yticks(h_ticks)
         # Custom tick labels
-        ax1.set_yticklabels([f'{int(val)} dB' for val in
-                             np.linspace(min_h_loss, h_scale,
-                                         5)])
+        ax1.set_yticklabels(h_tick_labels)
         # Move the radial labels to 135 degrees to avoid clutter
         ax1.set_rlabel_position(135)
 
@@ -195,26 +292,19 @@ class BaseAntenna(ABC):
         # Set min value at the outer ring; max loss at the center
         ax2.set_ylim(bottom=v_scale, top=min_v_loss)
         # Custom ticks for the radial axis
-        ax2.set_yticks(np.linspace(min_v_loss, v_scale, 5))
+        ax2.set_yticks(v_ticks)
         # Custom tick labels
-        ax2.set_yticklabels([f'{int(val)} dB' for val in
-                             np.linspace(min_v_loss, v_scale,
-                                         5)])
+        ax2.set_yticklabels(v_tick_labels)
         # Move the radial labels to 135 degrees
         ax2.set_rlabel_position(135)
 
         # change default plot labels to vary betwen -180, 0, 180
-        # 9 equally spaced ticks (0, 45, 90, ..., 360 degrees)
-        ax1.set_xticks(np.linspace(0, 2 * np.pi, 9))
-        ax2.set_xticks(np.linspace(0, 2 * np.pi, 9))
+        ax1.set_xticks(_THETA_TICKS)
+        ax2.set_xticks(_THETA_TICKS)
 
         # set custom theta tick labels
-        ax1.set_xticklabels(
-            ['0°', '45°', '90°', '135°', '180°', '-135°', '-90°',
-             '-45°', ''])
-        ax2.set_xticklabels(
-            ['0°', '45°', '90°', '135°', '180°', '-135°', '-90°',
-             '-45°', ''])
+        ax1.set_xticklabels(_THETA_TICK_LABELS)
+        ax2.set_xticklabels(_THETA_TICK_LABELS)
 
         # Add antenna settings/parameters to the figure
         info_txt = (
@@ -233,8 +323,11 @@ class BaseAntenna(ABC):
                  fontsize='small', color='gray')
 
         # Show the plots
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        if show:
+            plt.show()
+        else:
+            return fig
 
 
     def export(self, exporter, filename):
@@ -246,7 +339,49 @@ class BaseAntenna(ABC):
             filename: The name of the output file.
         """
         # Update specs property
-        self._update_specs()
+        self._refresh_specs()
 
         # Export the data
-        exporter.export(self.specs, filename)
\ No newline at end of file
+        exporter.export(self.specs, filename)
+
+
+    def export_many(self, exports):
+        """
+        Export the antenna's specifications to several files at once.
+
+        Parameters:
+            exports: Pairs of an exporter instance and the name of its
+                output file, e.g. [(CSVExport(), 'ant.csv'),
+                (MSIExport(), 'ant.msi')].
+
+        Raises:
+            ValueError: If two exports write to the same file.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Two exports writing the same file at once would garble it
+        exports = list(exports)
+        filenames = set()
+        for _, filename in exports:
+            path = os.path.abspath(filename)
+            if path in filenames:
+                raise ValueError(
+                    f"Duplicate output file! Each export must be written "
+                    f"to its own file: {filename}"
+                )
+            filenames.add(path)
+
+        # Update specs property once for all the exports
+        self._refresh_specs()
+
+        # Write the files concurrently; exporters only read the specs
+        max_workers = max(1, min(len(exports), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(exporter.export, self.specs, filename)
+                for exporter, filename in exports
+            ]
+
+        # Re-raise the first error of the exports, if any
+        for future in futures:
+            future.result()
\ No newline at end of file
@@ -1,36 +1,28 @@
-import importlib
-import os
-from base import BaseAntenna
+from antenna_models import MODEL_REGISTRY
 
 
 class Antenna:
     """Controller for any antenna model."""
 
+    # Registry of model classes by name
+    _model_registry = MODEL_REGISTRY
+
     def __init__(self, model_name):
-        self._load_models()
-        if model_name not in self._model_registry:
-            raise ValueError(f"Unknown model '{model_name}'. Available: {list(self._model_registry.keys())}")
-        self.model = self._model_registry[model_name]()
+        self.switch_model(model_name)
 
-    def _load_models(self):
-        """Dynamically load models from antenna_models/"""
-        self._model_registry = {}
-        # Resolve the path to antenna_models relative to this file
-        base_dir = os.path.dirname(__file__)  # Directory of controller.py
-        models_dir = os.path.join(base_dir, 'antenna_models')
 
-        if not os.path.exists(models_dir):
-            raise FileNotFoundError(f"Directory not found: {models_dir}")
+    def switch_model(self, model_name):
+        """Replace the antenna model with a new one of the given name.
 
-        for file in os.listdir(models_dir):
-            if file.endswith('.py') and not file.startswith('__'):  # Ignore __init__.py
-                module_name = file[:-3]
-                module_path = f'antenna_models.{module_name}'
-                module = importlib.import_module(module_path)
-                for cls in dir(module):
-                    obj = getattr(module, cls)
-                    if isinstance(obj, type) and issubclass(obj, BaseAntenna) and obj is not BaseAntenna:
-                        self._model_registry[obj.__name__] = obj
+        Parameters
+        ----------
+        model_name: str
+            Name of the model, e.g. 'ITUF699'. Its parameters are to be
+            set with set_params() of the new model.
+        """
+        if model_name not in self._model_registry:
+            raise ValueError(f"Unknown model '{model_name}'. Available: {list(self._model_registry.keys())}")
+        self.model = self._model_registry[model_name]()
 
 
     def export(self, exporter, filename='export.csv'):
@@ -44,3 +36,20 @@ class Antenna:
             The name of the output file.
         """
         self.model.export(exporter, filename)
+
+
+    def export_many(self, exports):
+        """Export the current antenna model's specs to several files at once.
+
+        Parameters
+        ----------
+        exports: iterable
+            Pairs of an exporter instance and the name of its output
+            file, e.g. [(CSVExport(), 'ant.csv'), (MSIExport(), 'ant.msi')].
+
+        Raises
+        ------
+        ValueError
+            If two exports write to the same file.
+        """
+        self.model.export_many(exports)
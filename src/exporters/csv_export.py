@@ -1,4 +1,6 @@
 import csv
+import numpy as np
+from .utils import array_to_list
 
 class CSVExport:
     def export(self, data, filename):
@@ -11,11 +13,16 @@ class CSVExport:
         filename : str
             Name of the output file.
         """
+        rows = []
+        for key, value in data.items():
+            if isinstance(value, dict):
+                for subkey, subvalue in value.items():
+                    # Write arrays the same way as lists
+                    if isinstance(subvalue, np.ndarray):
+                        subvalue = array_to_list(subvalue)
+                    rows.append([f"{key}.{subkey}", subvalue])
+            else:
+                rows.append([key, value])
+
         with open(filename, 'w', newline='') as file:
-            writer = csv.writer(file)
-            for key, value in data.items():
-                if isinstance(value, dict):
-                    for subkey, subvalue in value.items():
-                        writer.writerow([f"{key}.{subkey}", subvalue])
-                else:
-                    writer.writerow([key, value])
+            csv.writer(file).writerows(rows)
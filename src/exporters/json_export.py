@@ -1,4 +1,12 @@
 import json
+import numpy as np
+from .utils import array_to_list
+
+# Use the faster orjson serializer if it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class JSONExport:
     def export(self, data, filename):
@@ -11,5 +19,24 @@ class JSONExport:
         filename : str
             Name of the output file.
         """
-        with open(filename, 'w') as file:
-            json.dump(data, file, indent=4)
+        if orjson is not None:
+            text = orjson.dumps(data, default=self.__to_list,
+                                option=orjson.OPT_INDENT_2)
+            with open(filename, 'wb') as file:
+                file.write(text)
+        else:
+            with open(filename, 'w') as file:
+                json.dump(data, file, indent=4, default=self.__to_list)
+
+
+    @staticmethod
+    def __to_list(obj):
+        """Convert arrays and numpy scalars, which json can't serialize,
+        to lists and Python numbers."""
+        if isinstance(obj, np.ndarray):
+            return array_to_list(obj)
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable"
+        )
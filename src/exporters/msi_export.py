@@ -1,4 +1,26 @@
+import itertools
+import numpy as np
+from .utils import array_to_list
+
+# Pattern data line, e.g. "15 3.25"; the format string is parsed only once
+_ROW = '{} {}\n'.format
+
+
 class MSIExport:
+    # Basic antenna information, filled in from the `specs` property
+    _HEADER = (
+        "NAME {name}\n"
+        "MAKE {make}\n"
+        "FREQUENCY {frequency} MHz\n"
+        "H_WIDTH {h_width} Deg.\n"
+        "V_WIDTH {v_width} Deg.\n"
+        "FRONT_TO_BACK {front_to_back} dB\n"
+        "GAIN {gain} dBi\n"
+        "TILT {tilt} Deg.\n"
+        "POLARIZATION {polarization}\n"
+        "COMMENT {comment}\n"
+    )
+
     def export(self, data, filename):
         """Export antenna data to a file in MSI Planet format.
 
@@ -19,37 +41,40 @@ class MSIExport:
         # Remove angles above 360 (inclusive) from H-pattern data
         h_data = [
             (phi, loss)
-            for phi, loss in zip(data['h_pattern_datapoint']['phi'],
-                                 data['h_pattern_datapoint']['loss'])
+            for phi, loss in zip(
+                self.__to_list(data['h_pattern_datapoint']['phi']),
+                self.__to_list(data['h_pattern_datapoint']['loss']))
             if phi < 360  # Keep angles less than 360
         ]
-        h_data_sorted = sorted(h_data)  # Sort by angle (phi)
+        h_data.sort()  # Sort by angle (phi), linear if already sorted
 
         # Remove angles above 360 (inclusive) from V-pattern data
         v_data = [
             (theta, loss)
-            for theta, loss in zip(data['v_pattern_datapoint']['theta'],
-                                 data['v_pattern_datapoint']['loss'])
+            for theta, loss in zip(
+                self.__to_list(data['v_pattern_datapoint']['theta']),
+                self.__to_list(data['v_pattern_datapoint']['loss']))
             if theta < 360  # Keep angles less than 360
         ]
-        v_data_sorted = sorted(v_data)  # Sort by angle (theta)
+        v_data.sort()  # Sort by angle (theta), linear if already sorted
 
-        # Write data in MSI format to a file
+        # Basic antenna information
+        lines = [self._HEADER.format_map(data)]
+
+        # Pattern data
+        lines.append(f"HORIZONTAL 360\n")
+        lines.extend(itertools.starmap(_ROW, h_data))
+        lines.append(f"VERTICAL 360\n")
+        lines.extend(itertools.starmap(_ROW, v_data))
+
+        # Write data in MSI format to a file at once
         with open(filename, 'w') as file:
-            # Write basic antenna information
-            file.write(f"NAME {data['name']}\n")
-            file.write(f"MAKE {data['make']}\n")
-            file.write(f"FREQUENCY {data['frequency']} MHz\n")
-            file.write(f"H_WIDTH {data['h_width']} Deg.\n")
-            file.write(f"V_WIDTH {data['v_width']} Deg.\n")
-            file.write(f"FRONT_TO_BACK {data['front_to_back']} dB\n")
-            file.write(f"GAIN {data['gain']} dBi\n")
-            file.write(f"TILT {data['tilt']} Deg.\n")
-            file.write(f"POLARIZATION {data['polarization']}\n")
-            file.write(f"COMMENT {data['comment']}\n")
-            file.write(f"HORIZONTAL 360\n")
-            for phi, loss in h_data_sorted:
-                file.write(f"{phi} {loss}\n")
-            file.write(f"VERTICAL 360\n")
-            for theta, loss in v_data_sorted:
-                file.write(f"{theta} {loss}\n")
\ No newline at end of file
+            file.write(''.join(lines))
+
+
+    @staticmethod
+    def __to_list(values):
+        """Convert arrays to lists, leaving other sequences as they are."""
+        if isinstance(values, np.ndarray):
+            return array_to_list(values)
+        return values
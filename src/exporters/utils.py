@@ -0,0 +1,21 @@
+import math
+import numpy as np
+
+
+def array_to_list(array):
+    """Convert an array from the `specs` property to a list.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Angles or attenuation data; NaN marks an undefined attenuation.
+
+    Returns
+    -------
+    list
+        The array values, with 'n/a' in place of NaN.
+    """
+    values = array.tolist()
+    if np.issubdtype(array.dtype, np.floating) and np.isnan(array).any():
+        values = ['n/a' if math.isnan(value) else value for value in values]
+    return values
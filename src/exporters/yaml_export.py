@@ -1,4 +1,32 @@
-import yaml
+import functools
+import numpy as np
+from .utils import array_to_list
+
+
+@functools.cache
+def _dumper():
+    """Create YAML dumper which writes arrays the same way as lists and
+    numpy scalars as Python numbers."""
+    # Import YAML modules only when exporting to YAML is needed
+    import yaml
+
+    # Use the faster libyaml based dumper if PyYAML was built with it
+    base = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+    class Dumper(base):
+        pass
+
+    Dumper.add_representer(
+        np.ndarray,
+        lambda dumper, data: dumper.represent_list(array_to_list(data))
+    )
+    # Write numpy scalars (e.g. np.float64 parameters) as Python numbers
+    Dumper.add_multi_representer(
+        np.generic,
+        lambda dumper, data: dumper.represent_data(data.item())
+    )
+    return Dumper
+
 
 class YAMLExport:
     def export(self, data, filename):
@@ -11,5 +39,7 @@ class YAMLExport:
         filename : str
             Name of the output file.
         """
+        import yaml
+
         with open(filename, 'w') as file:
-            yaml.dump(data, file, default_flow_style=False)
+            yaml.dump(data, file, Dumper=_dumper(), default_flow_style=False)
@@ -1,3 +1,5 @@
+import numpy as np
+from matplotlib.figure import Figure
 from controller import Antenna
 from exporters.csv_export import CSVExport
 from exporters.json_export import JSONExport
@@ -28,6 +30,15 @@ my_antenna.model.set_params(
 # Calculate antenna gain
 print(f'G = {my_antenna.model.gain(azimuth=15.2, elevation=20.4):,.2f} dBi')
 
+# Check that gains at many directions at once are the same as gain() ones
+azimuths = [0, 15.2, -60, 120, 180]
+elevations = [0, 20.4, -10, 45, -90]
+np.testing.assert_allclose(
+    my_antenna.model.gain_batch(azimuths, elevations),
+    [my_antenna.model.gain(azimuth=az, elevation=el)
+     for az, el in zip(azimuths, elevations)]
+)
+
 # Display antenna radiation patterns
 my_antenna.model.show_patterns()
 
@@ -44,6 +55,15 @@ my_antenna.export(my_yaml_exporter, 'f1336s_ant.yaml')
 my_msi_exporter = MSIExport()  # MSI exporter object
 my_antenna.export(my_msi_exporter, 'f1336s_ant.msi')
 
+# Check that several exports to the same file at once are rejected
+try:
+    my_antenna.export_many([(my_csv_exporter, 'f1336s_ant.csv'),
+                            (my_json_exporter, 'f1336s_ant.csv')])
+except ValueError:
+    pass
+else:
+    raise AssertionError('export_many() accepted the same file twice')
+
 # Modify antenna to suite TETRA BTS 410-430 MHz as per source [2]
 my_antenna.model.set_params(
     oper_freq_mhz=420,  # TETRA Band 0100 center frequency
@@ -58,11 +78,8 @@ my_antenna.model.set_params(
 # Display radiation patterns of modified antenna
 my_antenna.model.show_patterns()
 
-# Delete antenna object
-del my_antenna
-
-# Create an object of ITUF699 Class (microwave link)
-my_antenna = Antenna('ITUF699')
+# Switch to a model of ITUF699 Class (microwave link)
+my_antenna.switch_model('ITUF699')
 
 # Set antenna's parameters as per [2]
 # https://www.itu.int/dms_pubrec/itu-r/rec/f/R-REC-F.758-7-201911-I!!PDF-E.pdf
@@ -74,17 +91,21 @@ my_antenna.model.set_params(
 # Calculate antenna gain
 print(f'G = {my_antenna.model.gain(off_axis_angle=15.2):,.2f} dBi')
 
+# Check that gains at many angles at once are the same as gain() ones
+angles = [0, 0.5, 15.2, 63.7, 180, -45]
+np.testing.assert_allclose(
+    my_antenna.model.gain_batch(angles),
+    [my_antenna.model.gain(off_axis_angle=angle) for angle in angles]
+)
+
 # Display antenna radiation patterns
 my_antenna.model.show_patterns()
 
 # Export the radiation patterns to MSI file
 my_antenna.export(my_msi_exporter, 'f699_ant.msi')
 
-# Delete antenna object
-del my_antenna
-
-# Create an object of ITUF1245 Class (microwave link)
-my_antenna = Antenna('ITUF1245')
+# Switch to a model of ITUF1245 Class (microwave link)
+my_antenna.switch_model('ITUF1245')
 
 # Set antenna's parameters as per [2]
 my_antenna.model.set_params(
@@ -96,6 +117,13 @@ my_antenna.model.set_params(
 # Calculate antenna gain
 print(f'G = {my_antenna.model.gain(off_axis_angle=15.2):,.2f} dBi')
 
+# Check that gains at many angles at once are the same as gain() ones
+angles = [0, 0.5, 15.2, 63.7, 180, -45]
+np.testing.assert_allclose(
+    my_antenna.model.gain_batch(angles),
+    [my_antenna.model.gain(off_axis_angle=angle) for angle in angles]
+)
+
 # Display antenna radiation patterns
 my_antenna.model.show_patterns()
 
@@ -124,11 +152,8 @@ my_antenna.model.set_params(
 # Display antenna radiation patterns
 my_antenna.model.show_patterns()
 
-# Delete antenna object
-del my_antenna
-
-# Create an object of ITUF1336o Class (omni antenna)
-my_antenna = Antenna('ITUF1336o')
+# Switch to a model of ITUF1336o Class (omni antenna)
+my_antenna.switch_model('ITUF1336o')
 
 # Set arbitrary antenna's parameters
 my_antenna.model.set_params(
@@ -139,8 +164,47 @@ my_antenna.model.set_params(
     tilt_type='none',
 )
 
+# Check that gains at many angles at once are the same as gain() ones
+angles = [0, 5, -30, 90, -90, 120]
+np.testing.assert_allclose(
+    my_antenna.model.gain_batch(angles),
+    [my_antenna.model.gain(elevation=angle) for angle in angles]
+)
+
 # Display antenna radiation patterns
 my_antenna.model.show_patterns()
 
+# Check tilts which put +/-90 deg. elevations a bit beyond 90 deg. once
+# tilted; a gain must be calculated there, as for any other tilt
+for tilt_angle in (-86.7, -66.8):
+    my_antenna.model.set_params(
+        oper_freq_mhz=5000,
+        max_gain_dbi=10,
+        pattern_type='peak',
+        performance_type='typical',
+        tilt_type='electrical',
+        tilt_angle_deg=tilt_angle,
+    )
+    assert my_antenna.model.gain(elevation=90) is not None
+    # Patterns are calculated for all elevations without errors, and
+    # the figure is returned instead of being displayed
+    assert isinstance(my_antenna.model.show_patterns(show=False), Figure)
+
+# Switch to a model of ITUF1336lg Class (low-gain antenna)
+my_antenna.switch_model('ITUF1336lg')
+
+# Set arbitrary antenna's parameters
+my_antenna.model.set_params(
+    oper_freq_mhz=1500,
+    max_gain_dbi=10,
+)
+
+# Check that gains at many angles at once are the same as gain() ones
+angles = [0, 10, 45.5, 90, 180, -135]
+np.testing.assert_allclose(
+    my_antenna.model.gain_batch(angles),
+    [my_antenna.model.gain(off_axis_angle=angle) for angle in angles]
+)
+
 # Delete antenna object
 del my_antenna
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 from controller import Antenna
 from exporters.msi_export import MSIExport
 
@@ -20,9 +21,18 @@ my_antenna.model.set_params(
 #print(f"G={my_antenna.model.gain(off_axis_angle=3):,.2f} dBi")
 print(my_antenna.model.gain(off_axis_angle=180))
 
-# Issue with when gain() returns None to be solved for show_patterns()
 my_antenna.model.show_patterns()
 
+# Check that gains at many angles at once are the same as gain() ones,
+# with NaN below phi_min (here at 0 deg.)
+angles = [0, 13, 30, 60, 180, -90]
+gains = my_antenna.model.gain_batch(angles)
+np.testing.assert_allclose(
+    gains,
+    [my_antenna.model.gain(off_axis_angle=angle) for angle in angles]
+)
+assert np.isnan(gains[0]) and np.isnan(my_antenna.model.gain(off_axis_angle=0))
+
 # Export antenna specs to files
 my_msi_exporter = MSIExport()  # MSI exporter object
 my_antenna.export(my_msi_exporter, 's465_ant.msi')
\ No newline at end of file